@@ -39,7 +39,10 @@ def run_scraper(
 
         job_type = config.get('job_type', 'web')
         typer.echo(f"Running job: {config.get('name', 'Unnamed Job')} (Type: {job_type.upper()})")
-        typer.echo(f"Output format: {output_format}")
+        if config.get('streaming'):
+            typer.echo(f"Output format: jsonl (streaming is enabled, so --format {output_format} is ignored)")
+        else:
+            typer.echo(f"Output format: {output_format}")
         logger_cli.info(f"Loaded configuration from: {config_file}")
 
         scraper_instance = None
@@ -73,7 +76,11 @@ def run_scraper(
         elif output_format_lower == 'sqlite': storage = SQLiteStorage(storage_config)
         else: typer.echo(f"Error: Unsupported output format '{output_format}'.", err=True); raise typer.Exit(1)
 
-        if result.get('data'):
+        if result.get('data_file'):
+            typer.echo(f"\nScraping completed successfully!")
+            typer.echo(f"Results streamed to: {result['data_file']} (JSON Lines)")
+            typer.echo(f"Statistics: {result.get('stats', {})}")
+        elif result.get('data'):
             output_path = storage.save(result['data'])
             typer.echo(f"\nScraping completed successfully!")
             typer.echo(f"Results saved to: {output_path}")
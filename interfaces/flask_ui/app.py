@@ -1,6 +1,6 @@
 # File: web-data-scraper/interfaces/web_app/app.py (Updated for API)
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, abort
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, abort, send_from_directory
 from pathlib import Path
 import yaml
 import json
@@ -18,6 +18,7 @@ from scraper.dynamic_scraper import DynamicScraper
 from scraper.storage.csv_handler import CSVStorage
 from scraper.storage.json_handler import JSONStorage
 from scraper.storage.sqlite_handler import SQLiteStorage
+from scraper.storage.stream_writer import read_jsonl_head
 from scraper.utils.logger import setup_logging
 from scraper.utils.config_loader import ConfigLoader
 from jsonschema import ValidationError as JsonSchemaValidationError # Alias to avoid name clash
@@ -322,7 +323,12 @@ def run_scraper(config_file):
         result = scraper_instance.run(); logger.info(f"Run completed. Stats: {result.get('stats')}")
         output_path_str = ""; data_to_save = result.get('data')
 
-        if data_to_save:
+        if result.get('data_file'): # streaming: true -- items are already on disk as JSON Lines
+            output_path_str = result['data_file']; output_format = 'jsonl'
+            try: data_to_save = read_jsonl_head(Path(output_path_str), 10)
+            except (OSError, ValueError) as e: logger.warning(f"Could not read preview from {output_path_str}: {e}"); data_to_save = []
+            logger.info(f"Results streamed to: {output_path_str}"); flash('Success! Results streamed to disk (JSONL).', 'success')
+        elif data_to_save:
             storage = None; fmt_lower = output_format.lower(); storage_cfg=config_for_run
             if fmt_lower == 'csv': storage = CSVStorage(storage_cfg)
             elif fmt_lower == 'json': storage = JSONStorage(storage_cfg)
@@ -336,16 +342,24 @@ def run_scraper(config_file):
                  logger.error(f"Failed to save results: {e}", exc_info=True); flash(f"Failed to save results: {e}", "error"); output_path_str = f"Error saving: {e}"
         else: flash('Scraping finished, but no data was collected or saved.', 'warning'); output_path_str = "N/A"
 
-        relative_path_str = "N/A"
+        relative_path_str = "N/A"; download_path = None
         if output_path_str and output_path_str != "N/A" and "Error" not in output_path_str:
              try: relative_path = Path(output_path_str).relative_to(Path.cwd()); relative_path_str = str(relative_path)
              except (ValueError, TypeError): relative_path_str = output_path_str
+             # Files under OUTPUT_DIR get a download link (see download_output)
+             try: download_path = Path(output_path_str).resolve().relative_to(OUTPUT_DIR.resolve()).as_posix()
+             except (ValueError, TypeError): download_path = None
         elif "Error" in output_path_str: relative_path_str = output_path_str
 
-        return render_template('results.html', job_name=config.get('name', safe_filename), output_path=relative_path_str, output_format=output_format.upper(), stats=result.get('stats',{}), sample_data=data_to_save[:10] if data_to_save else [])
+        return render_template('results.html', job_name=config.get('name', safe_filename), output_path=relative_path_str, output_format=output_format.upper(), download_path=download_path, stats=result.get('stats',{}), sample_data=data_to_save[:10] if data_to_save else [])
 
     except (JsonSchemaValidationError, yaml.YAMLError) as e: error_path = " -> ".join(map(str, getattr(e, 'path', []))) or "Config root"; message = f"Config Error running {safe_filename}: {getattr(e, 'message', str(e))} (at {error_path})"; logger.error(message); flash(message, 'error'); return redirect(url_for('index'))
     except Exception as e: logger.exception(f"Error running job {safe_filename}: {e}"); flash(f"Scraping failed for '{config.get('name', safe_filename)}': {e}", 'error'); return render_template('error.html', error=str(e), config_file=safe_filename)
 
+@app.route('/download/<path:filename>')
+def download_output(filename):
+    # send_from_directory refuses paths that escape OUTPUT_DIR
+    return send_from_directory(OUTPUT_DIR.resolve(), filename, as_attachment=True)
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5001)
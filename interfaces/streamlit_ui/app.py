@@ -39,6 +39,7 @@ from scraper.api_scraper import APIScraper
 from scraper.storage.csv_handler import CSVStorage
 from scraper.storage.json_handler import JSONStorage
 from scraper.storage.sqlite_handler import SQLiteStorage
+from scraper.storage.stream_writer import read_jsonl_head
 from jsonschema import ValidationError as JsonSchemaValidationError
 
 log_level = logging.INFO
@@ -324,7 +325,11 @@ def run_and_display_job(config_path_or_name, is_example=False):
                     else: scraper_instance = HTMLScraper(config_for_run)
                 else: raise ValueError(f"Invalid job_type '{job_type}'.")
                 result = scraper_instance.run(); results_data = result.get('data'); stats_data = result.get('stats')
-                if results_data is not None and len(results_data) > 0 :
+                streamed_file = result.get('data_file')
+                if streamed_file: # streaming: true -- items are already on disk as JSON Lines
+                    job_output_format = 'jsonl'; output_path_str = streamed_file; results_data = None
+                    logger.info(f"Job '{job_name_for_dir}' results streamed to: {output_path_str}")
+                elif results_data is not None and len(results_data) > 0 :
                     storage = None
                     if job_output_format == 'json': storage = JSONStorage(config_for_run)
                     elif job_output_format == 'sqlite': storage = SQLiteStorage(config_for_run)
@@ -334,7 +339,12 @@ def run_and_display_job(config_path_or_name, is_example=False):
                 else: output_path_str = "No data extracted to save (data is None)."
             except (JsonSchemaValidationError, yaml.YAMLError) as e: error_path = " -> ".join(map(str, getattr(e, 'path', []))) or "Config root"; error_message = f"Config Error: {getattr(e, 'message', str(e))} (at {error_path})"; logger.error(error_message)
             except Exception as e: error_message = f"Scraping failed: {e}"; logger.exception(f"Error running job {job_display_name} via Streamlit")
-            st.session_state[results_key] = {"raw_data_for_download": results_data if results_data else [], "output_path_on_disk": output_path_str, "saved_format": job_output_format if (results_data is not None and len(results_data) > 0) else "N/A", "stats": stats_data or {}, "sample_data": results_data[:10] if results_data else [], "error": error_message}
+            streamed = job_output_format == 'jsonl' and not error_message
+            sample_data = results_data[:10] if results_data else []
+            if streamed:
+                try: sample_data = read_jsonl_head(Path(output_path_str), 10)
+                except (OSError, ValueError) as e: logger.warning(f"Could not read preview from {output_path_str}: {e}")
+            st.session_state[results_key] = {"raw_data_for_download": results_data if results_data else [], "output_path_on_disk": output_path_str, "saved_format": job_output_format if (streamed or (results_data is not None and len(results_data) > 0)) else "N/A", "stats": stats_data or {}, "sample_data": sample_data, "error": error_message}
             st.rerun()
     if st.session_state.get(results_key):
         results = st.session_state[results_key]; st.subheader("📊 Job Execution Summary")
@@ -345,7 +355,9 @@ def run_and_display_job(config_path_or_name, is_example=False):
                 output_filename_on_disk = Path(output_path_on_disk).name
                 st.success(f"🎉 Success! Your data has been extracted and saved as **{output_filename_on_disk}** (Format: {saved_format.upper()}).")
                 st.markdown(f"Full path on server: `{output_path_on_disk}`")
-                if raw_data_for_download:
+                if saved_format == "jsonl": # Streamed crawls can be large; leave the file on disk rather than load it for a download button
+                    st.info("Streamed results are written incrementally as JSON Lines; open the file at the path above.")
+                elif raw_data_for_download:
                     try:
                         download_data_bytes = b""; download_mime = "text/plain"
                         if saved_format == "csv": df_download = pd.DataFrame(raw_data_for_download); download_data_bytes = df_download.to_csv(index=False).encode('utf-8'); download_mime = "text/csv"
@@ -240,7 +240,6 @@ class APIScraper(BaseScraper):
             and the original configuration ('config').
         """
         self.stats['start_time'] = time.time() # Record job start
-        all_extracted_data: List[Dict] = []
         endpoints = self.api_config.get('endpoints', [])
 
         if not endpoints:
@@ -248,28 +247,32 @@ class APIScraper(BaseScraper):
             self.stats['end_time'] = time.time()
             return {'data': [], 'stats': self.get_stats(), 'config': self.config}
 
-        # --- Iterate through each configured endpoint ---
-        for endpoint in endpoints:
-             # Construct full URL primarily for logging/context
-             base_url = self.api_config.get('base_url','').rstrip('/')
-             full_url = f"{base_url}/{endpoint.lstrip('/')}" if base_url else endpoint
+        all_extracted_data = self._new_result_sink()
 
-             # Fetch data for the current endpoint
-             response_data = self.fetch_data(endpoint) # Handles retries, proxies etc.
-
-             if response_data:
-                 # If fetch and JSON parse succeeded, extract items
-                 page_data = self.extract_data(response_data, full_url)
-                 all_extracted_data.extend(page_data)
-             # else: fetch_data already logged the failure
+        try:
+            # --- Iterate through each configured endpoint ---
+            for endpoint in endpoints:
+                 # Construct full URL primarily for logging/context
+                 base_url = self.api_config.get('base_url','').rstrip('/')
+                 full_url = f"{base_url}/{endpoint.lstrip('/')}" if base_url else endpoint
+
+                 # Fetch data for the current endpoint
+                 response_data = self.fetch_data(endpoint) # Handles retries, proxies etc.
+
+                 if response_data:
+                     # If fetch and JSON parse succeeded, extract items
+                     page_data = self.extract_data(response_data, full_url)
+                     all_extracted_data.extend(page_data)
+                 # else: fetch_data already logged the failure
+        except BaseException:
+            self._abandon_result_sink(all_extracted_data)
+            raise
+        finally:
+            self.close() # Release pooled connections before processing
 
         # --- Process all aggregated data ---
         processed_data = self._process_extracted_data(all_extracted_data)
 
         # --- Finalize and return ---
         self.stats['end_time'] = time.time()
-        return {
-            'data': processed_data,
-            'stats': self.get_stats(),
-            'config': self.config
-        }
+        return self._build_result(processed_data)
@@ -1,14 +1,26 @@
 from abc import ABC, abstractmethod
 import logging
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
+from pathlib import Path
 from urllib.robotparser import RobotFileParser
 from urllib.parse import urlparse, urljoin
 import time
+import threading
 import requests
 from requests.exceptions import ProxyError, Timeout, HTTPError, RequestException
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from bs4 import BeautifulSoup # Keep for potential future use in base class, though not used directly now
 from .data_processor import DataProcessor
+from .storage.stream_writer import StreamingWriter
 from .utils.proxy_rotator import ProxyRotator
+# --- Import httpx (optional, enables HTTP/2 fetching) ---
+try:
+    import httpx
+    HTTPX_INSTALLED = True
+except ImportError:
+    HTTPX_INSTALLED = False
+    # Warning will be logged during __init__ if http2 is requested without httpx
 
 # Helper function moved inside or kept separate as preferred
 def _proxy_to_str(proxy_dict: Optional[Dict]) -> str:
@@ -30,8 +42,12 @@ class BaseScraper(ABC):
     - Basic statistics tracking.
     - Data processing delegation to DataProcessor.
     - Retry logic for fetching pages.
+    - Optional streaming of extracted items to disk (`streaming: true`).
+    - Optional HTTP/2 fetching over a persistent httpx client (`http2: true`).
     """
 
+    STREAM_CHUNK_SIZE = 1000 # Items processed per chunk in streaming mode
+
     def __init__(self, config: Dict):
         """
         Initializes the BaseScraper.
@@ -40,11 +56,17 @@ class BaseScraper(ABC):
             config: A dictionary containing the validated scraping configuration.
                     Expected keys include 'user_agent', 'respect_robots',
                     'request_delay', 'max_retries', 'proxies',
-                    'processing_rules', 'output_dir'.
+                    'processing_rules', 'output_dir', 'streaming', 'http2'.
         """
         self.config = config
         self.logger = logging.getLogger(self.__class__.__name__) # Logger named after the subclass
         self.session = requests.Session()
+        # Keep-alive pool per host large enough for concurrent fetches, so
+        # connections are reused instead of discarded when the pool is full
+        pool_size = max(10, int(config.get('max_concurrency', 1)))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
 
         # Set User-Agent (defaulting to a common bot if not provided)
         default_ua = 'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)'
@@ -60,6 +82,11 @@ class BaseScraper(ABC):
         else:
              self.logger.info("robots.txt checking disabled.")
 
+        # Locks guarding shared state when fetch_page runs in worker threads
+        # (robots.txt parser, proxy rotator, stats) and spacing concurrent requests
+        self._lock = threading.RLock()
+        self._throttle_lock = threading.Lock()
+
         # Request throttling state
         self.last_request_time: float = 0.0
         self.request_delay: float = float(config.get('request_delay', 1.0)) # Ensure float
@@ -80,6 +107,7 @@ class BaseScraper(ABC):
         # Data processing setup
         self.data_processor = DataProcessor(config)
         self.processing_rules = config.get('processing_rules', {})
+        self.streaming: bool = bool(config.get('streaming', False))
 
         # Proxy rotation setup
         self.proxy_rotator: Optional[ProxyRotator] = None
@@ -90,6 +118,13 @@ class BaseScraper(ABC):
         else:
             self.logger.info("No proxies configured.")
 
+        # HTTP/2 client setup (created lazily, shared by all direct requests of a run)
+        self.http2: bool = bool(config.get('http2', False))
+        self._http2_client: Optional[Any] = None
+        if self.http2 and not HTTPX_INSTALLED:
+            self.logger.warning("http2 is enabled but httpx is not installed (pip install 'httpx[http2]'). Falling back to requests.")
+            self.http2 = False
+
 
     def _setup_robot_parser_for_domain(self, base_url: str):
         """
@@ -182,23 +217,56 @@ class BaseScraper(ABC):
         Returns:
             The text content of the page if successful, otherwise None.
         """
+        response = self._fetch_response(url, max_retries)
+        if response is None:
+            return None
+        # Try to decode content correctly
+        response.encoding = response.apparent_encoding or 'utf-8'
+        return response.text
+
+    def fetch_page_bytes(self, url: str, max_retries: Optional[int] = None) -> Optional[Tuple[bytes, str]]:
+        """
+        Like `fetch_page`, but returns the undecoded body and its detected encoding.
+
+        Lets byte-oriented parsers (lxml) decode the page themselves instead of
+        receiving a decoded str that has to be re-encoded.
+
+        Returns:
+            (raw content, encoding) if successful, otherwise None.
+        """
+        response = self._fetch_response(url, max_retries)
+        if response is None:
+            return None
+        return response.content, response.apparent_encoding or 'utf-8'
+
+    def _fetch_response(self, url: str, max_retries: Optional[int] = None) -> Optional[requests.Response]:
+        """
+        Performs the request behind `fetch_page`/`fetch_page_bytes`.
+
+        Returns:
+            The successful response, or None if disallowed or all attempts failed.
+        """
         # 1. Check robots.txt permission first
-        if not self.check_robots_permission(url):
+        with self._lock:
+            allowed = self.check_robots_permission(url)
+        if not allowed:
             return None
 
         retries = max_retries if max_retries is not None else self.config.get('max_retries', 3)
         self.logger.info(f"Fetching URL: {url}")
 
         for attempt in range(retries + 1):
-            # 2. Throttle request before making it
-            self.throttle_requests()
+            # 2. Throttle request before making it (concurrent fetches take turns)
+            with self._throttle_lock:
+                self.throttle_requests()
 
             current_proxy: Optional[Dict] = None
             proxies_to_use: Optional[Dict] = None
 
             # 3. Get proxy if rotator is enabled
             if self.proxy_rotator:
-                current_proxy = self.proxy_rotator.rotate()
+                with self._lock:
+                    current_proxy = self.proxy_rotator.rotate()
                 if current_proxy:
                      self.logger.debug(f"Attempt {attempt + 1}: Using proxy {_proxy_to_str(current_proxy)}")
                      proxies_to_use = current_proxy
@@ -211,27 +279,30 @@ class BaseScraper(ABC):
 
             # 4. Make the request
             try:
-                response = self.session.get(
-                    url,
-                    timeout=self.config.get('page_load_timeout', 30),
-                    proxies=proxies_to_use # Use the selected proxy (or empty dict for direct)
-                )
+                if self.http2 and not proxies_to_use:
+                    response = self._http2_get(url, timeout=self.config.get('page_load_timeout', 30))
+                else:
+                    response = self.session.get(
+                        url,
+                        timeout=self.config.get('page_load_timeout', 30),
+                        proxies=proxies_to_use # Use the selected proxy (or empty dict for direct)
+                    )
                 response.raise_for_status() # Raise HTTPError for bad status codes (4xx or 5xx)
 
                 # Success
-                self.stats['pages_scraped'] += 1
+                with self._lock:
+                    self.stats['pages_scraped'] += 1
                 self.logger.debug(f"Successfully fetched {url} (Status: {response.status_code})")
-                # Try to decode content correctly
-                response.encoding = response.apparent_encoding or 'utf-8'
-                return response.text
+                return response
 
             # 5. Handle Exceptions (Order Matters: More specific first)
             except ProxyError as e:
                  self.logger.warning(f"Attempt {attempt + 1}/{retries + 1} failed for {url} with ProxyError: {e}")
-                 self.stats['proxy_failures'] += 1
-                 if self.proxy_rotator and current_proxy:
-                      self.proxy_rotator.mark_bad(current_proxy)
-                      self.logger.info(f"Marked proxy {_proxy_to_str(current_proxy)} as bad.")
+                 with self._lock:
+                      self.stats['proxy_failures'] += 1
+                      if self.proxy_rotator and current_proxy:
+                           self.proxy_rotator.mark_bad(current_proxy)
+                           self.logger.info(f"Marked proxy {_proxy_to_str(current_proxy)} as bad.")
                  # No need to break, retry might use a different proxy or direct connection
 
             except Timeout as e:
@@ -261,7 +332,8 @@ class BaseScraper(ABC):
             else:
                 # Log final failure after all retries
                 self.logger.error(f"All {retries + 1} attempts failed for {url}.")
-                self.stats['pages_failed'] += 1
+                with self._lock:
+                    self.stats['pages_failed'] += 1
                 # Ensure session proxies are cleared if last attempt used one
                 self.session.proxies = {}
                 return None # Return None after all retries fail
@@ -271,16 +343,138 @@ class BaseScraper(ABC):
         return None
 
 
-    def _process_extracted_data(self, data: List[Dict]) -> List[Dict]:
+    def _get_http2_client(self) -> Optional[Any]:
+        """
+        Returns the shared httpx client, creating it on first use.
+
+        Disables HTTP/2 for this scraper (returning None) if the client cannot
+        be created, e.g. when the optional `h2` package is missing.
+        """
+        with self._lock:
+            if self._http2_client is None:
+                try:
+                    self._http2_client = httpx.Client(
+                        http2=True,
+                        headers=dict(self.session.headers),
+                        follow_redirects=True,
+                        limits=httpx.Limits(max_keepalive_connections=20),
+                    )
+                    self.logger.debug("Created HTTP/2 client.")
+                except ImportError as e:
+                    self.logger.warning(f"Could not enable HTTP/2 ({e}). Falling back to requests.")
+                    self.http2 = False
+            return self._http2_client
+
+    def _http2_get(self, url: str, timeout: float) -> requests.Response:
+        """
+        Performs a GET over the shared HTTP/2 client.
+
+        The httpx response and exceptions are translated to their `requests`
+        equivalents so `fetch_page` handles both transports identically.
+        """
+        client = self._get_http2_client()
+        if client is None:
+            return self.session.get(url, timeout=timeout)
+        try:
+            http2_response = client.get(url, timeout=timeout)
+        except httpx.ProxyError as e:
+            raise ProxyError(str(e)) from e
+        except httpx.TimeoutException as e:
+            raise Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise RequestException(str(e)) from e
+
+        response = requests.Response()
+        response.status_code = http2_response.status_code
+        response.reason = http2_response.reason_phrase
+        response.url = str(http2_response.url)
+        response.headers = CaseInsensitiveDict(http2_response.headers)
+        response._content = http2_response.content
+        response.encoding = http2_response.charset_encoding
+        return response
+
+    def close(self) -> None:
+        """Closes open HTTP connections. The scraper can still be run again afterwards."""
+        if self._http2_client is not None:
+            self._http2_client.close()
+            self._http2_client = None
+        self.session.close()
+
+    def _new_result_sink(self) -> Union[List[Dict], StreamingWriter]:
+        """
+        Returns the container `run()` collects extracted items into.
+
+        A plain list by default; a StreamingWriter spilling to
+        `<output_dir>/<job_name>/<job_name>_<timestamp>.jsonl` when streaming is enabled.
+        """
+        if not self.streaming:
+            return []
+        safe_job_name = "".join(c if c.isalnum() else '_' for c in self.config.get('name', 'job'))
+        stream_path = Path(self.config.get('output_dir', 'outputs')) / safe_job_name / f"{safe_job_name}_{int(time.time())}.jsonl"
+        self.logger.info(f"Streaming extracted items to {stream_path}")
+        return StreamingWriter(stream_path)
+
+    def _abandon_result_sink(self, sink: Union[List[Dict], StreamingWriter]) -> None:
+        """
+        Closes the result sink of a run that failed part-way.
+
+        In streaming mode this releases the file handle and reports the partial
+        JSON Lines file left on disk; a plain list needs nothing.
+        """
+        if isinstance(sink, StreamingWriter):
+            sink.close()
+            self.logger.warning(f"Run aborted; {len(sink)} items streamed so far are left in {sink.filepath}")
+
+    def _build_result(self, processed_data: Union[List[Dict], StreamingWriter]) -> Dict:
+        """
+        Assembles the dictionary returned by `run()`.
+
+        In streaming mode 'data' is left empty and 'data_file' holds the path
+        of the JSON Lines file containing the processed items.
+        """
+        if isinstance(processed_data, StreamingWriter):
+            processed_data.close()
+            return {'data': [], 'data_file': str(processed_data.filepath), 'stats': self.get_stats(), 'config': self.config}
+        return {'data': processed_data, 'stats': self.get_stats(), 'config': self.config}
+
+    def _process_streamed_data(self, data: StreamingWriter) -> StreamingWriter:
+        """
+        Applies processing rules to a streamed result file chunk by chunk.
+
+        Processed items are written to a sibling `*_processed.jsonl` file and the
+        raw file is removed. Without processing rules the raw file is returned as is.
+        """
+        data.close()
+        self.stats['items_extracted'] += len(data)
+        if not self.processing_rules or not len(data):
+            self.logger.debug("No processing rules defined or no data to process.")
+            self.stats['items_processed'] = self.stats['items_extracted']
+            return data
+
+        processed_path = data.filepath.with_name(f"{data.filepath.stem}_processed.jsonl")
+        self.logger.info(f"Applying {len(self.processing_rules)} processing rule categories to {len(data)} streamed items...")
+        with StreamingWriter(processed_path) as processed:
+            for chunk in data.iter_chunks(self.STREAM_CHUNK_SIZE):
+                processed.write_all(self.data_processor.process(chunk, self.processing_rules))
+        data.filepath.unlink(missing_ok=True)
+        self.stats['items_processed'] = len(processed)
+        self.logger.info(f"Finished processing. {len(processed)} items written to {processed_path}")
+        return processed
+
+    def _process_extracted_data(self, data: Union[List[Dict], StreamingWriter]) -> Union[List[Dict], StreamingWriter]:
         """
         Applies processing rules to the extracted data using the DataProcessor.
 
         Args:
-            data: A list of dictionaries representing the raw extracted items.
+            data: A list of dictionaries representing the raw extracted items,
+                  or the StreamingWriter they were streamed into.
 
         Returns:
-            A list of dictionaries representing the processed items.
+            A list of dictionaries representing the processed items, or a
+            StreamingWriter over the processed file in streaming mode.
         """
+        if isinstance(data, StreamingWriter):
+            return self._process_streamed_data(data)
         self.stats['items_extracted'] += len(data)
         if not self.processing_rules or not data:
             self.logger.debug("No processing rules defined or no data to process.")
@@ -329,7 +523,7 @@ class BaseScraper(ABC):
         """
         # Example structure reminder for subclasses:
         # self.stats['start_time'] = time.time()
-        # all_data = []
+        # all_data = self._new_result_sink()
         # # ... loop through URLs/endpoints ...
         #     content = self.fetch_page(url) # or specific fetch logic
         #     if content:
@@ -338,7 +532,7 @@ class BaseScraper(ABC):
         #     # ... handle pagination ...
         # processed_data = self._process_extracted_data(all_data)
         # self.stats['end_time'] = time.time()
-        # return {'data': processed_data, 'stats': self.get_stats(), 'config': self.config}
+        # return self._build_result(processed_data)
         pass
 
 
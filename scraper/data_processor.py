@@ -1,9 +1,17 @@
 from typing import Dict, List, Any, Optional
 import re
+from functools import lru_cache
 from datetime import datetime, date
 import logging
 import json # Keep import although only used in _convert_type currently
 
+# Patterns used by the built-in text cleaning rules, compiled once
+_NEWLINES_RE = re.compile(r'[\r\n\t]+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\-.,]', flags=re.UNICODE)
+# User patterns from processing rules (regex_replace, validation 'pattern') are compiled
+# once per process; re.sub/re.match would re-check re's internal cache on every value
+_compile_rule_pattern = lru_cache(maxsize=256)(re.compile)
+
 # Helper function for nested access (if not imported from a shared utils module)
 # Consider moving this to a utils module if used elsewhere
 def get_nested_value(data_dict: Optional[Dict | List], key_path: str, default: Any = None) -> Any:
@@ -328,12 +336,12 @@ class DataProcessor:
         if rules.get('uppercase', False): # Default: No uppercase
              cleaned_text = cleaned_text.upper()
         if rules.get('remove_newlines', True): # Default: Replace newlines with space
-             cleaned_text = re.sub(r'[\r\n\t]+', ' ', cleaned_text)
+             cleaned_text = _NEWLINES_RE.sub(' ', cleaned_text)
         if rules.get('remove_extra_spaces', True): # Default: Consolidate multiple spaces
              cleaned_text = ' '.join(cleaned_text.split())
         if rules.get('remove_special_chars', False): # Default: Keep special chars
              # Example: Remove chars except letters, numbers, whitespace, hyphen, period, comma
-             cleaned_text = re.sub(r'[^\w\s\-.,]', '', cleaned_text, flags=re.UNICODE)
+             cleaned_text = _SPECIAL_CHARS_RE.sub('', cleaned_text)
              # Note: This regex might need adjustment based on specific needs
 
         # Handle regex replacements
@@ -342,7 +350,7 @@ class DataProcessor:
             for pattern, replacement in regex_replace_rules.items():
                  try:
                      # Ensure replacement is a string
-                     cleaned_text = re.sub(pattern, str(replacement), cleaned_text)
+                     cleaned_text = _compile_rule_pattern(pattern).sub(str(replacement), cleaned_text)
                  except re.error as e:
                       self.logger.error(f"Invalid regex pattern '{pattern}' in text_cleaning: {e}")
                  except TypeError:
@@ -406,7 +414,7 @@ class DataProcessor:
                  if not isinstance(pattern, str):
                       self.logger.error(f"Invalid 'pattern' rule for field '{field_name_for_log}': Must be a string.")
                       return False
-                 if not re.match(pattern, str_value):
+                 if not _compile_rule_pattern(pattern).match(str_value):
                       # Log only the start of the value if it's long
                       value_repr = repr(str_value[:50]) + ('...' if len(str_value) > 50 else '')
                       self.logger.debug(f"Validation failed for field '{field_name_for_log}': Value {value_repr} does not match pattern '{pattern}'.")
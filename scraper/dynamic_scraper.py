@@ -2,8 +2,11 @@
 # - Corrected extract_data to expect XPath selectors to point to elements.
 # - Selenium's .text or .get_attribute() will be used on found WebElements.
 
-from typing import Dict, List, Optional, Any, Set
+from typing import Callable, Dict, Hashable, List, Optional, Any, Set, Tuple
 from urllib.parse import urljoin, urlparse
+import atexit
+import os
+import threading
 import time
 import logging
 
@@ -27,21 +30,159 @@ def _proxy_to_str(proxy_dict: Optional[Dict]) -> str:
     url = proxy_dict.get('https', proxy_dict.get('http', 'N/A'))
     return url
 
+
+class DriverPool:
+    """
+    Pool of warm WebDriver instances, keyed by the options they were launched with.
+
+    Lends an idle driver to each DynamicScraper run and takes it back when the
+    run finishes, so consecutive jobs skip the 1-3 second browser startup.
+    Drivers keep their launch options (headless, images, proxy, user agent, ...),
+    so an idle driver is only handed to a run whose launch key is identical.
+    """
+
+    def __init__(self, max_size: int = 3):
+        """
+        Initializes the DriverPool.
+
+        Args:
+            max_size: Maximum number of idle drivers kept warm across all keys.
+                      Drivers released while the pool is full are quit instead.
+        """
+        self.max_size = max_size
+        self._idle: Dict[Hashable, List[WebDriver]] = {}
+        self._idle_count = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def acquire(self, key: Hashable, factory: Callable[[], Optional[WebDriver]]) -> Optional[WebDriver]:
+        """
+        Returns a live idle driver launched with `key`, or one created by `factory`.
+
+        Idle drivers that no longer respond (e.g. the browser crashed) are
+        discarded and the next one is tried.
+        """
+        while True:
+            with self._lock:
+                drivers = self._idle.get(key)
+                if not drivers:
+                    break
+                driver = drivers.pop()
+                self._idle_count -= 1
+                if not drivers:
+                    del self._idle[key]
+            try:
+                driver.get("about:blank") # Liveness check that also resets the page
+                self.logger.info("Reusing pooled WebDriver instance.")
+                return driver
+            except WebDriverException as e:
+                self.logger.warning(f"Discarding dead pooled WebDriver: {e}")
+                self._quit(driver)
+        return factory()
+
+    def release(self, key: Hashable, driver: WebDriver) -> None:
+        """Clears session state from `driver` and returns it to the pool under `key`."""
+        try:
+            try: # Chrome can drop cookies, storage and cache of every origin, not just the current page's
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+                driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': '*', 'storageTypes': 'all'})
+                driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+            except (AttributeError, WebDriverException):
+                driver.delete_all_cookies()
+        except WebDriverException as e:
+            self.logger.warning(f"Pooled WebDriver failed on release, discarding it: {e}")
+            self._quit(driver)
+            return
+        with self._lock:
+            pooled = self._idle_count < self.max_size
+            if pooled:
+                self._idle.setdefault(key, []).append(driver)
+                self._idle_count += 1
+        if pooled:
+            self.logger.info("WebDriver returned to pool.")
+        else:
+            self._quit(driver)
+
+    def close_all(self) -> None:
+        """Quits every idle driver. The shared pool registers this with `atexit`."""
+        with self._lock:
+            drivers = [driver for idle in self._idle.values() for driver in idle]
+            self._idle.clear()
+            self._idle_count = 0
+        for driver in drivers:
+            self._quit(driver)
+
+    def _quit(self, driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.debug(f"Error quitting WebDriver: {e}")
+
+
+# Process-wide pool shared by jobs with `reuse_driver: true`, created on first use
+_SHARED_DRIVER_POOL: Optional[DriverPool] = None
+_SHARED_DRIVER_POOL_LOCK = threading.Lock()
+
+
+def get_shared_driver_pool() -> DriverPool:
+    """Returns the process-wide DriverPool, creating it on first use."""
+    global _SHARED_DRIVER_POOL
+    if _SHARED_DRIVER_POOL is None:
+        with _SHARED_DRIVER_POOL_LOCK:
+            if _SHARED_DRIVER_POOL is None:
+                _SHARED_DRIVER_POOL = DriverPool()
+                atexit.register(_SHARED_DRIVER_POOL.close_all)
+    return _SHARED_DRIVER_POOL
+
+
 class DynamicScraper(BaseScraper):
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, pool: Optional[DriverPool] = None):
         super().__init__(config)
         self.driver: Optional[WebDriver] = None
+        self.login_config: Optional[Dict] = config.get('login_config')
+        # An explicit pool wins; otherwise reuse_driver opts into the shared one
+        if pool is None and config.get('reuse_driver', False):
+            pool = get_shared_driver_pool()
+        if pool is not None and self.login_config:
+            # A pooled browser could carry this job's logged-in session into the next one
+            self.logger.info("login_config is set; launching a dedicated WebDriver instead of using the pool.")
+            pool = None
+        self.pool: Optional[DriverPool] = pool
+        self._driver_key: Optional[Tuple] = None
         self.selectors: Dict = config.get('selectors', {})
         self.selector_type: str = self.selectors.get('type', 'css').lower()
         self.pagination_config: Optional[Dict] = config.get('pagination')
-        self.login_config: Optional[Dict] = config.get('login_config')
         self.logger.info(f"DynamicScraper initialized (Selector Type: {self.selector_type.upper()})")
 
     def _init_driver(self) -> Optional[WebDriver]:
         if self.driver:
             self.logger.warning("WebDriver already initialized. Returning existing instance.")
             return self.driver
-
+        current_proxy_config, proxy_arg, proxy_display_str = self._select_proxy()
+        if self.pool:
+            self._driver_key = self._driver_launch_key(proxy_arg)
+            return self.pool.acquire(self._driver_key, lambda: self._launch_driver(current_proxy_config, proxy_arg, proxy_display_str))
+        return self._launch_driver(current_proxy_config, proxy_arg, proxy_display_str)
+
+    def _driver_launch_key(self, proxy_arg: Optional[str]) -> Tuple:
+        """Returns the launch options pooled drivers must share to be reused for this job."""
+        return (
+            bool(self.config.get('headless', True)),
+            bool(self.config.get('disable_images', True)),
+            proxy_arg,
+            self.session.headers["User-Agent"],
+            self.config.get('webdriver_path'),
+            self.config.get('page_load_timeout', 30),
+        )
+
+    def _select_proxy(self) -> Tuple[Optional[Dict], Optional[str], str]:
+        """
+        Picks the proxy for the next WebDriver launch.
+
+        Returns:
+            (proxy config, '--proxy-server=...' argument, display string); the
+            config and argument are None when no usable proxy is available.
+        """
         current_proxy_config: Optional[Dict] = None
         proxy_arg: Optional[str] = None
         proxy_display_str: str = "None"
@@ -65,6 +206,9 @@ class DynamicScraper(BaseScraper):
                      current_proxy_config = None
             else:
                  self.logger.warning("Proxy rotator enabled, but no working proxies are available. Will attempt direct connection.")
+        return current_proxy_config, proxy_arg, proxy_display_str
+
+    def _launch_driver(self, current_proxy_config: Optional[Dict], proxy_arg: Optional[str], proxy_display_str: str) -> Optional[WebDriver]:
 
         options = webdriver.ChromeOptions()
         driver_path = self.config.get('webdriver_path')
@@ -381,7 +525,7 @@ class DynamicScraper(BaseScraper):
 
     def run(self) -> Dict:
         self.stats['start_time'] = time.time()
-        all_extracted_data: List[Dict] = []
+        all_extracted_data = self._new_result_sink()
         initial_urls = self.config.get("urls", [])
         if isinstance(initial_urls, str): initial_urls = [initial_urls]
 
@@ -409,7 +553,7 @@ class DynamicScraper(BaseScraper):
                     self.logger.warning("No target URLs provided and login not configured or failed. Cannot start scraping.")
 
             if not urls_to_scrape:
-                self.stats['end_time'] = time.time(); return {'data': [], 'stats': self.get_stats(), 'config': self.config}
+                self.stats['end_time'] = time.time(); return self._build_result(self._process_extracted_data(all_extracted_data))
 
             scraped_urls: Set[str] = set()
             max_pages = float('inf')
@@ -461,11 +605,14 @@ class DynamicScraper(BaseScraper):
 
         processed_data = self._process_extracted_data(all_extracted_data)
         self.stats['end_time'] = time.time()
-        return {'data': processed_data, 'stats': self.get_stats(), 'config': self.config}
+        return self._build_result(processed_data)
 
     def _close_driver(self):
          if self.driver:
              driver_instance = self.driver; self.driver = None
+             if self.pool:
+                 self.pool.release(self._driver_key, driver_instance)
+                 return
              try:
                  self.logger.info("Closing WebDriver instance..."); driver_instance.quit()
                  self.logger.info("WebDriver closed successfully.")
@@ -1,8 +1,17 @@
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import time # Already imported in BaseScraper, but good for explicitness if used here
+import hashlib
+import json
 import logging
-from urllib.parse import urljoin
-from typing import Dict, List, Optional, Any, Set
-from bs4 import BeautifulSoup
+import threading
+from functools import lru_cache
+import re
+from html import unescape
+from urllib.parse import urljoin, urlsplit
+from typing import Callable, Deque, Dict, List, Optional, Any, Set, Tuple, Union
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve # Installed with beautifulsoup4; used to precompile CSS selectors
 from .base_scraper import BaseScraper
 # --- Import LXML ---
 try:
@@ -11,6 +20,118 @@ try:
 except ImportError:
     LXML_INSTALLED = False
     # Warning will be logged during __init__ if XPath is requested without lxml
+# --- Import cssselect (optional, lets CSS selectors run on lxml trees) ---
+try:
+    from cssselect import HTMLTranslator, SelectorError
+    CSSSELECT_INSTALLED = True
+except ImportError:
+    CSSSELECT_INSTALLED = False
+    # CSS selectors fall back to BeautifulSoup when cssselect is unavailable
+# --- Import selectolax (optional, fastest CSS engine) ---
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+    SELECTOLAX_INSTALLED = True
+except ImportError:
+    SELECTOLAX_INSTALLED = False
+
+# --- Raw-HTML matching for simple pagination selectors ---
+# Selectors like "a.next" or "a[rel=next]" are resolved with regexes on the
+# raw HTML instead of building a BeautifulSoup tree just to find one link.
+_SIMPLE_CLASS_SELECTOR_RE = re.compile(r'^a\.([\w-]+)$')
+_SIMPLE_ATTR_SELECTOR_RE = re.compile(r'''^a\[([\w-]+)=(["']?)([\w-]+)\2\]$''')
+# Anchor start tags without the leading '<' (group 1), ending at the first '>' outside
+# quoted attribute values. Comments and script/style/textarea/title contents are matched
+# as a whole so links inside them are skipped, like an HTML parser would.
+_ANCHOR_TAG_RE = re.compile(
+    r'<(?:!--.*?(?:-->|\Z)'
+    r'|(script|style|textarea|title)\b.*?(?:</\1\s*>|\Z)'
+    r'''|(a\b(?:[^>"']|"[^"]*"|'[^']*')*>))''',
+    re.IGNORECASE | re.DOTALL,
+)
+_TAG_ATTR_RE = re.compile(r'''([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))''')
+# Item selectors a SoupStrainer can express: "tag", ".class", "#id", "tag.class", "tag#id"
+_STRAINABLE_SELECTOR_RE = re.compile(r'^([a-zA-Z][\w-]*)?(?:([.#])([\w-]+))?$')
+# Field selectors that only test the element itself (tag, class, id, attributes; no
+# combinators, lists or pseudo-classes), so they match the same inside a strained item
+_COMPOUND_SELECTOR_RE = re.compile(r'''^(?:[a-zA-Z][\w-]*|\*)?(?:[.#][\w-]+|\[\s*[\w-]+\s*(?:[~|^$*]?=\s*(?:"[^"]*"|'[^']*'|[\w-]+)\s*)?\])*$''')
+
+# Field attributes whose values are resolved against the page URL
+_URL_ATTRS = frozenset(('href', 'src'))
+# Values starting with these are already absolute and skip urljoin
+_ABSOLUTE_URL_PREFIXES = ('http://', 'https://', '//', 'data:')
+
+# urljoin re-parses the page URL on every call; relative links also tend to
+# repeat across items and pages (navigation, category links), so memoize joins.
+_cached_urljoin = lru_cache(maxsize=4096)(urljoin)
+
+
+@lru_cache(maxsize=256)
+def _url_origin(url: str) -> Optional[str]:
+    """Returns 'scheme://netloc' of `url`, or None if it lacks either."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme and parts.netloc else None
+
+
+def _resolve_url(base: str, value: str) -> str:
+    """
+    Equivalent of `urljoin(base, value)` for a relative `value`.
+
+    Root-relative paths without dot segments (the common "/product/123" case)
+    are appended to the page's cached origin without reparsing the base URL;
+    anything else goes through the memoized urljoin.
+    """
+    if value.startswith('/') and not value.startswith('//') and '/.' not in value:
+        origin = _url_origin(base)
+        if origin:
+            return origin + value
+    return _cached_urljoin(base, value)
+
+
+@lru_cache(maxsize=256)
+def _css_to_xpath(selector: str) -> str:
+    """
+    Translates a CSS selector to XPath with cssselect, memoized per process.
+
+    Translation is pure, so jobs re-created with the same config (repeated runs,
+    several scrapers sharing selectors) skip re-tokenizing each selector.
+    """
+    return HTMLTranslator().css_to_xpath(selector)
+
+# Opt-in LRU of (page digest, page URL, selectors fingerprint) -> (items, next page URL),
+# shared by all HTMLScraper instances in the process (see `extract_cache_size`)
+_EXTRACT_CACHE: "OrderedDict[Tuple[bytes, str, str], Tuple[List[Dict], Optional[str]]]" = OrderedDict()
+_EXTRACT_CACHE_LOCK = threading.Lock()
+
+# Elements whose text BeautifulSoup's get_text() leaves out
+_NON_TEXT_TAGS = frozenset(('script', 'style'))
+
+
+def _lxml_stripped_text(element: Any) -> str:
+    """Equivalent of BeautifulSoup's `get_text(strip=True)` for an lxml element."""
+    parts = []
+    for node in element.iter():
+        # Comments/processing instructions have a non-string tag; only their tail is text.
+        # A selected <script>/<style> keeps its own text, as with get_text().
+        if isinstance(node.tag, str) and (node is element or node.tag not in _NON_TEXT_TAGS) and node.text:
+            parts.append(node.text)
+        if node is not element and node.tail:
+            parts.append(node.tail)
+    return "".join(part.strip() for part in parts)
+
+
+def _lexbor_stripped_text(node: Any) -> str:
+    """Equivalent of BeautifulSoup's `get_text(strip=True)` for a selectolax node."""
+    # Native text extraction matches get_text() unless script/style text must be skipped
+    # (css() also matches the node itself, so a selected <script> takes the slow path)
+    if node.css_first('script, style') is None:
+        return node.text(deep=True, separator='', strip=True)
+    parts = []
+    for child in node.traverse(include_text=True):
+        if child.tag == '-text':
+            parent = child.parent
+            if parent == node or parent.tag not in _NON_TEXT_TAGS:
+                parts.append(child.text_content.strip())
+    return "".join(parts)
 
 
 class HTMLScraper(BaseScraper):
@@ -36,6 +157,12 @@ class HTMLScraper(BaseScraper):
         self.selectors: Dict = config.get('selectors', {})
         self.selector_type: str = self.selectors.get('type', 'css').lower()
         self.pagination_config: Optional[Dict] = config.get('pagination')
+        self.max_concurrency: int = max(1, int(config.get('max_concurrency', 1)))
+        self.extract_cache_size: int = max(0, int(config.get('extract_cache_size', 0)))
+        # Identifies the extraction rules in cache keys, so jobs with different selectors never share entries
+        self._selectors_fingerprint: str = hashlib.blake2b(
+            json.dumps([self.selectors, self.pagination_config], sort_keys=True, default=str).encode('utf-8'),
+            digest_size=16).hexdigest()
 
         if self.selector_type == 'xpath' and not LXML_INSTALLED:
             msg = "lxml library is required for XPath support in HTMLScraper, but it's not installed. Please run: pip install lxml"
@@ -43,18 +170,446 @@ class HTMLScraper(BaseScraper):
             raise ImportError(msg)
 
         self.bs_parser: str = 'lxml' if LXML_INSTALLED else 'html.parser'
-        self.logger.info(f"HTMLScraper initialized (Selector Type: {self.selector_type.upper()}, BS4 Parser: {self.bs_parser})")
 
+        # (attribute, value, match_word) for simple CSS pagination selectors, else None
+        self._simple_next_page_match: Optional[Tuple[str, str, bool]] = None
+        if self.selector_type == 'css' and self.pagination_config:
+            self._simple_next_page_match = self._parse_simple_link_selector(self.pagination_config.get('next_page_selector') or '')
+
+        # Precompiled XPath evaluators (XPath mode only), built once per job
+        self._item_xpath: Optional[Any] = None
+        self._field_xpaths: Dict[str, Any] = {}
+        self._next_page_xpath: Optional[Any] = None
+        if self.selector_type == 'xpath':
+            self._compile_xpath_selectors()
+
+        # CSS engine, fastest available first: 'lexbor' (selectolax), 'lxml' (cssselect
+        # translated XPath) or 'bs4'. None in XPath mode.
+        self._css_item_xpath: Optional[Any] = None
+        self._css_field_xpaths: Dict[str, Any] = {}
+        self._css_next_xpath: Optional[Any] = None
+        self._css_engine: Optional[str] = None
+        # Precompiled soupsieve selectors ('bs4' engine only): item, per-field and next-page
+        self._compiled_item: Optional[Any] = None
+        self._compiled_fields: Dict[str, Any] = {}
+        self._compiled_next: Optional[Any] = None
+        if self.selector_type == 'css':
+            if SELECTOLAX_INSTALLED and self._lexbor_supports_selectors():
+                self._css_engine = 'lexbor'
+            elif LXML_INSTALLED and CSSSELECT_INSTALLED and self._compile_css_selectors():
+                self._css_engine = 'lxml'
+            else:
+                self._css_engine = 'bs4'
+                self._compile_soupsieve_selectors()
+
+        # 'bs4' engine only: build just the item subtrees when the item selector is simple
+        # and pagination never needs the tree (see _build_item_strainer)
+        self._item_strainer: Optional[SoupStrainer] = None
+        if self._css_engine == 'bs4':
+            self._item_strainer = self._build_item_strainer()
+
+        # XPath and the lxml CSS engine parse raw bytes; the others parse decoded text
+        self._parses_with_lxml: bool = self.selector_type == 'xpath' or self._css_engine == 'lxml'
+        self._thread_parsers = threading.local() # Per-thread lxml parser cache, see _lxml_parser
+
+        # Per-field extractors specialized to this config: (field, selector, extractor)
+        self._field_extractors: List[Tuple[str, str, Callable[[Any, str], Any]]] = self._build_field_extractors()
+
+        # Fields marked `required: true` are extracted first; an item missing one is
+        # rejected without evaluating the remaining selectors
+        self._required_fields: Set[str] = {
+            field for field, selector_config in self.selectors.get('fields', {}).items()
+            if isinstance(selector_config, dict) and selector_config.get('required')
+        }
+        self._extraction_order = sorted(self._field_extractors, key=lambda entry: entry[0] not in self._required_fields)
+
+        self.logger.info(f"HTMLScraper initialized (Selector Type: {self.selector_type.upper()}, CSS Engine: {self._css_engine or 'n/a'}, BS4 Parser: {self.bs_parser})")
+
+
+    def _compile_xpath_selectors(self) -> None:
+        """
+        Compiles the item and field XPath expressions into reusable `etree.XPath` objects.
+
+        Raises:
+            ValueError: If any configured XPath expression is syntactically invalid,
+                        so broken configs fail at startup rather than once per item.
+        """
+        item_selector = self.selectors.get('item')
+        current_selector = item_selector
+        try:
+            if item_selector:
+                self._item_xpath = etree.XPath(item_selector)
+            for field, selector_config in self.selectors.get('fields', {}).items():
+                first_only = False
+                if isinstance(selector_config, dict):
+                    current_selector = selector_config.get('selector')
+                    first_only = bool(selector_config.get('first'))
+                else:
+                    current_selector = selector_config
+                if current_selector:
+                    # `first: true` lets libxml2 stop at the first match instead of collecting them all
+                    self._field_xpaths[field] = etree.XPath(f"({current_selector})[1]" if first_only else current_selector)
+        except etree.XPathError as e:
+            msg = f"Configuration error: Invalid XPath expression '{current_selector}': {e}"
+            self.logger.error(msg)
+            raise ValueError(msg) from e
+
+        # Pagination errors have always been reported per page rather than at startup,
+        # so an invalid next-page expression falls back to string evaluation.
+        # Only the first match is used, so the compiled form selects just that one.
+        next_page_selector = (self.pagination_config or {}).get('next_page_selector')
+        if next_page_selector:
+            try:
+                self._next_page_xpath = etree.XPath(f"({next_page_selector})[1]")
+            except etree.XPathError as e:
+                self.logger.warning(f"Could not precompile pagination XPath '{next_page_selector}': {e}")
+
+    def _configured_css_selectors(self) -> List[str]:
+        """Returns the item, field and next-page selectors present in the config."""
+        selectors = [self.selectors.get('item')]
+        for selector_config in self.selectors.get('fields', {}).values():
+            selectors.append(selector_config.get('selector') if isinstance(selector_config, dict) else selector_config)
+        if self.pagination_config:
+            selectors.append(self.pagination_config.get('next_page_selector'))
+        return [selector for selector in selectors if selector]
+
+    def _lexbor_supports_selectors(self) -> bool:
+        """Checks that selectolax can parse every configured CSS selector."""
+        probe = LexborHTMLParser("<html></html>")
+        for selector in self._configured_css_selectors():
+            try:
+                probe.css(selector)
+            except SelectolaxError as e:
+                self.logger.info(f"CSS selector '{selector}' not supported by selectolax ({e}). Using a slower CSS engine.")
+                return False
+        return True
+
+    def _compile_css_selectors(self) -> bool:
+        """
+        Translates the item and field CSS selectors to compiled `etree.XPath` objects.
+
+        Field selectors are evaluated once per page over the whole document, and
+        each item then collects its matches for all fields in a single walk of
+        its subtree (see `_group_css_matches`), instead of one BeautifulSoup
+        `select()` walk per field.
+
+        Returns:
+            False if cssselect cannot translate a selector (e.g. soupsieve-only
+            pseudo-classes), in which case the BeautifulSoup path is used.
+        """
+        current_selector = self.selectors.get('item')
+        try:
+            item_xpath = etree.XPath(_css_to_xpath(current_selector)) if current_selector else None
+            field_xpaths = {}
+            for field, selector_config in self.selectors.get('fields', {}).items():
+                current_selector = selector_config.get('selector') if isinstance(selector_config, dict) else selector_config
+                if current_selector:
+                    # Document-wide, so combinators may reach above the item as with Tag.select()
+                    field_xpaths[field] = etree.XPath(_css_to_xpath(current_selector))
+            current_selector = (self.pagination_config or {}).get('next_page_selector')
+            next_xpath = etree.XPath(_css_to_xpath(current_selector)) if current_selector else None
+        except (SelectorError, etree.XPathError) as e:
+            self.logger.info(f"CSS selector '{current_selector}' not supported by cssselect ({e}). Using BeautifulSoup for CSS extraction.")
+            return False
+        self._css_item_xpath = item_xpath
+        self._css_field_xpaths = field_xpaths
+        self._css_next_xpath = next_xpath
+        return True
+
+    def _compile_soupsieve_selectors(self) -> None:
+        """
+        Compiles the CSS selectors used on BeautifulSoup trees once per job.
+
+        Raises:
+            ValueError: If any configured CSS selector is syntactically invalid.
+        """
+        current_selector = self.selectors.get('item')
+        try:
+            if current_selector:
+                self._compiled_item = soupsieve.compile(current_selector)
+            for field, selector_config in self.selectors.get('fields', {}).items():
+                current_selector = selector_config.get('selector') if isinstance(selector_config, dict) else selector_config
+                if current_selector:
+                    self._compiled_fields[field] = soupsieve.compile(current_selector)
+            current_selector = (self.pagination_config or {}).get('next_page_selector')
+            if current_selector:
+                self._compiled_next = soupsieve.compile(current_selector)
+        except soupsieve.SelectorSyntaxError as e:
+            msg = f"Configuration error: Invalid CSS selector '{current_selector}': {e}"
+            self.logger.error(msg)
+            raise ValueError(msg) from e
+
+    def _build_item_strainer(self) -> Optional[SoupStrainer]:
+        """
+        Builds a SoupStrainer that keeps only the elements matched by a simple item selector.
+
+        Field selectors are evaluated inside each item, so nothing outside the item
+        subtrees is needed -- unless pagination has to search the tree, which is
+        only avoided when the next-page selector is resolved on raw HTML, or a
+        field selector has combinators that can reach ancestors of the item
+        (e.g. "section.list h2").
+
+        Returns:
+            The strainer, or None if the page must be parsed in full.
+        """
+        if self.pagination_config and not self._simple_next_page_match:
+            return None
+        for selector_config in self.selectors.get('fields', {}).values():
+            field_selector = selector_config.get('selector') if isinstance(selector_config, dict) else selector_config
+            if field_selector and not _COMPOUND_SELECTOR_RE.match(field_selector.strip()):
+                return None
+        match = _STRAINABLE_SELECTOR_RE.match((self.selectors.get('item') or '').strip())
+        if not match or not any(match.groups()):
+            return None
+        tag, kind, value = match.groups()
+        attrs = {}
+        if kind == '.': # The strainer sees the raw class attribute, so match one word of it
+            attrs['class'] = re.compile(rf'(?:^|\s){re.escape(value)}(?:\s|$)')
+        elif kind == '#':
+            attrs['id'] = value
+        return SoupStrainer(tag.lower() if tag else None, attrs)
+
+    def _build_field_extractors(self) -> List[Tuple[str, str, Callable[[Any, str], Any]]]:
+        """
+        Specializes the per-field extraction logic to the configured selectors.
+
+        The selector string/dict parsing, selector-type dispatch and URL
+        post-processing decisions are made once here instead of for every item.
+        Extractors take `(element, page_url)`; those that do not resolve URLs
+        ignore the page URL, so they can be used without a wrapper.
+        Fields without a selector are reported once and skipped.
+
+        Returns:
+            A list of (field name, selector, extractor) tuples where
+            `extractor(element, page_url)` returns the field's value or None.
+        """
+        extractors = []
+        for field, selector_config in self.selectors.get('fields', {}).items():
+            current_selector: Optional[str] = None
+            attr: Optional[str] = None
+            if isinstance(selector_config, str):
+                current_selector = selector_config
+            elif isinstance(selector_config, dict):
+                current_selector = selector_config.get('selector')
+                attr = selector_config.get('attr')
+
+            if not current_selector:
+                self.logger.warning(f"Selector missing for field '{field}'. Skipping field.")
+                continue
+
+            if self.selector_type == 'xpath':
+                raw_extract = self._make_xpath_field_extractor(self._field_xpaths[field], attr)
+            elif self._css_engine == 'lexbor':
+                raw_extract = self._make_lexbor_field_extractor(current_selector, attr)
+            elif self._css_engine == 'lxml':
+                raw_extract = self._make_lxml_css_field_extractor(field, attr)
+            else:
+                raw_extract = self._make_css_field_extractor(self._compiled_fields[field], attr)
+
+            if self.selector_type == 'css' and attr not in _URL_ATTRS:
+                # CSS extractors already return stripped, non-empty strings or None,
+                # so plain text/attribute fields need no post-processing wrapper
+                extractors.append((field, current_selector, raw_extract))
+            else:
+                extractors.append((field, current_selector, self._wrap_value_postprocessing(raw_extract, attr)))
+        return extractors
+
+    @staticmethod
+    def _make_xpath_field_extractor(compiled_xpath: Any, attr: Optional[str]) -> Callable[[Any, str], Any]:
+        """Returns a function extracting one field from an lxml element with a compiled XPath."""
+        def text_of(node: Any) -> str:
+            if not len(node): # Leaf element (the usual field target): its text is all there is
+                return node.text.strip() if node.text else ''
+            # tostring(method="text") beats text_content()/itertext() on nested elements
+            return etree.tostring(node, method="text", encoding="unicode", with_tail=False).strip()
+
+        def extract(element: Any, url: str) -> Any:
+            results = compiled_xpath(element)
+            if not results:
+                return None
+
+            # XPath can return elements, text, attributes, or booleans/numbers.
+            # We are primarily interested in text or attribute strings.
+            first_result = results[0]
+            if isinstance(first_result, etree._Element): # If XPath selected an element
+                value = first_result.get(attr) if attr else text_of(first_result)
+            elif hasattr(first_result, 'strip'): # If XPath directly returned a string (e.g., from text() or @attr)
+                value = str(first_result).strip()
+            else: # Other types (e.g. boolean or number from an XPath function)
+                value = str(first_result)
+
+            if len(results) > 1 and value is not None:
+                # If multiple text nodes or attributes were returned, concatenate them.
+                # This is common for selectors like ".//div/text()" which might return multiple text segments.
+                if all(isinstance(r, str) for r in results):
+                    value = " ".join(r.strip() for r in results if r.strip()).strip()
+                elif all(isinstance(r, etree._Element) for r in results):
+                    if attr:
+                        value = ", ".join(r.get(attr, "").strip() for r in results if r.get(attr, "").strip()).strip()
+                    else:
+                        value = " ".join(text_of(r) for r in results).strip()
+            return value
+        return extract
+
+    @staticmethod
+    def _make_css_field_extractor(compiled_selector: Any, attr: Optional[str]) -> Callable[[Any, str], Any]:
+        """Returns a function extracting one field from a BeautifulSoup Tag with a compiled CSS selector."""
+        if attr:
+            def extract(element: Any, url: str) -> Any:
+                value_list = [el.get(attr, "").strip() for el in compiled_selector.select(element) if el.get(attr, "").strip()]
+                return ", ".join(value_list) if value_list else None
+        else:
+            def extract(element: Any, url: str) -> Any:
+                value_list = [el.get_text(strip=True) for el in compiled_selector.select(element) if el.get_text(strip=True)]
+                return " ".join(value_list) if value_list else None
+        return extract
+
+    @staticmethod
+    def _make_lxml_css_field_extractor(field: str, attr: Optional[str]) -> Callable[[Any, str], Any]:
+        """
+        Returns a function extracting one field from an item's grouped lxml
+        matches (see `_group_css_matches`). Mirrors `_make_css_field_extractor` output.
+        """
+        if attr:
+            def extract(item_matches: Dict[str, List[Any]], url: str) -> Any:
+                value_list = [el.get(attr, "").strip() for el in item_matches.get(field, ()) if el.get(attr, "").strip()]
+                return ", ".join(value_list) if value_list else None
+        else:
+            def extract(item_matches: Dict[str, List[Any]], url: str) -> Any:
+                value_list = [text for text in (_lxml_stripped_text(el) for el in item_matches.get(field, ())) if text]
+                return " ".join(value_list) if value_list else None
+        return extract
+
+    @staticmethod
+    def _group_css_matches(item: Any, fields_by_node: Dict[Any, List[str]]) -> Dict[str, List[Any]]:
+        """
+        Collects, in document order, the page-level field matches that are
+        descendants of `item`, walking the item's subtree once for all fields.
+        """
+        item_matches: Dict[str, List[Any]] = {}
+        for node in item.iterdescendants():
+            for field in fields_by_node.get(node, ()):
+                item_matches.setdefault(field, []).append(node)
+        return item_matches
+
+    @staticmethod
+    def _make_lexbor_field_extractor(selector: str, attr: Optional[str]) -> Callable[[Any, str], Any]:
+        """
+        Returns a function extracting one field from a selectolax node.
+        Mirrors `_make_css_field_extractor` output.
+        """
+        # selectolax's Node.css() also matches the node itself; Tag.select() only searches descendants
+        if attr:
+            def extract(element: Any, url: str) -> Any:
+                value_list = [value for value in ((el.attributes.get(attr) or "").strip() for el in element.css(selector) if el != element) if value]
+                return ", ".join(value_list) if value_list else None
+        else:
+            def extract(element: Any, url: str) -> Any:
+                value_list = [text for text in (_lexbor_stripped_text(el) for el in element.css(selector) if el != element) if text]
+                return " ".join(value_list) if value_list else None
+        return extract
+
+    def _wrap_value_postprocessing(self, extract: Callable[[Any, str], Any], attr: Optional[str]) -> Callable[[Any, str], Any]:
+        """Adds URL resolution (for href/src attributes) or whitespace normalization to `extract`."""
+        if attr in _URL_ATTRS:
+            logger = self.logger
+
+            def extractor(element: Any, url: str) -> Any:
+                value = extract(element, url)
+                if isinstance(value, str):
+                    if not value:
+                        return None
+                    if not value.startswith(_ABSOLUTE_URL_PREFIXES):
+                        try: value = _resolve_url(url, value)
+                        except ValueError: logger.warning(f"Could not resolve relative URL '{value}' relative to base '{url}'.")
+                return value
+        else:
+            def extractor(element: Any, url: str) -> Any:
+                value = extract(element, url)
+                if isinstance(value, str):
+                    value = value.strip() if value else None # Ensure None if stripping results in empty
+                    return value or None
+                return value
+        return extractor
+
+    def _parse_html(self, html_content: Union[str, bytes], url: str, encoding: Optional[str] = None) -> Optional[Any]:
+        """
+        Parses a page into the tree type used by the configured engine.
+
+        lxml for XPath and the lxml CSS engine, a selectolax parser for the
+        'lexbor' engine, and a BeautifulSoup object otherwise. The result is
+        shared by `_extract_from_tree` and `_next_page_from_tree`.
+
+        Args:
+            html_content: Decoded page text, or raw bytes (lxml engines, see `_fetch_document`).
+            url: Page URL, for logging.
+            encoding: Encoding of `html_content` when it is bytes.
+
+        Returns:
+            The parsed tree, or None if parsing failed.
+        """
+        try:
+            if self._parses_with_lxml:
+                if not LXML_INSTALLED: # Should have been caught in __init__ but double check
+                    self.logger.error("LXML not installed, cannot parse HTML for XPath.")
+                    return None
+                if isinstance(html_content, str):
+                    html_content, encoding = html_content.encode('utf-8', 'replace'), 'utf-8'
+                try:
+                    # Without an explicit encoding libxml2 assumes Latin-1 for pages lacking a <meta charset>
+                    parser = self._lxml_parser(encoding)
+                except LookupError: # Python codec name libxml2 does not know (e.g. 'utf_8'); decode here instead
+                    html_content = html_content.decode(encoding or 'utf-8', 'replace').encode('utf-8')
+                    parser = self._lxml_parser('utf-8')
+                tree = lxml_html.fromstring(html_content, parser=parser) # Use lxml_html.fromstring
+                if tree is None:
+                     self.logger.error(f"lxml failed to parse HTML from {url}")
+                return tree
+            if self._css_engine == 'lexbor':
+                return LexborHTMLParser(html_content)
+            return BeautifulSoup(html_content, self.bs_parser, parse_only=self._item_strainer)
+        except etree.XMLSyntaxError as e:
+            self.logger.error(f"lxml failed to parse HTML for {url}: {e}")
+        except Exception as e:
+            self.logger.error(f"Unexpected error parsing HTML from {url}: {e}", exc_info=True)
+        return None
+
+    def _lxml_parser(self, encoding: Optional[str]) -> Any:
+        """
+        Returns a reusable `etree.HTMLParser(recover=True)` for `encoding`.
+
+        Parsers are cached per thread, since an lxml parser must not be used
+        by two threads at once.
+
+        Raises:
+            LookupError: If libxml2 does not know `encoding`.
+        """
+        parsers = getattr(self._thread_parsers, 'by_encoding', None)
+        if parsers is None:
+            parsers = self._thread_parsers.by_encoding = {}
+        parser = parsers.get(encoding)
+        if parser is None:
+            parser = parsers[encoding] = etree.HTMLParser(recover=True, encoding=encoding)
+        return parser
 
     def extract_data(self, html_content: str, url: str) -> List[Dict]: # Renamed html to html_content
         """
         Extracts structured data from the provided HTML content.
-        (This is existing method, ensure it's compatible with lxml elements if using XPath)
+
+        Thin wrapper parsing `html_content` and delegating to `_extract_from_tree`.
         """
         if not html_content:
             self.logger.warning(f"Received empty HTML content for URL: {url}")
             return []
+        tree = self._parse_html(html_content, url)
+        if tree is None:
+            return []
+        return self._extract_from_tree(tree, url)
 
+    def _extract_from_tree(self, tree: Any, url: str) -> List[Dict]:
+        """
+        Extracts structured data from a page already parsed by `_parse_html`.
+        """
         items = []
         item_selector = self.selectors.get('item')
         field_selectors = self.selectors.get('fields', {})
@@ -70,112 +625,65 @@ class HTMLScraper(BaseScraper):
             elements: List[Any] = [] # Ensure elements is defined before conditional assignment
             # --- Select top-level item elements using either XPath or CSS ---
             if self.selector_type == 'xpath':
-                if not LXML_INSTALLED: # Should have been caught in __init__ but double check
-                    self.logger.error("LXML not installed, cannot use XPath for item selection.")
-                    return []
-                parser = etree.HTMLParser(recover=True)
-                tree = lxml_html.fromstring(html_content.encode('utf-8', 'replace'), parser=parser) # Use lxml_html.fromstring
-                if tree is None:
-                     self.logger.error(f"lxml failed to parse HTML from {url}")
-                     return []
-                elements = tree.xpath(item_selector)
+                elements = self._item_xpath(tree)
                 self.logger.debug(f"Found {len(elements)} potential item elements using XPath: '{item_selector}'")
+            elif self._css_engine == 'lexbor': # CSS selectors evaluated natively by selectolax
+                elements = tree.css(item_selector)
+                self.logger.debug(f"Found {len(elements)} potential item elements using CSS: '{item_selector}'")
+            elif self._css_engine == 'lxml': # CSS selectors compiled to XPath, evaluated with lxml
+                elements = self._css_item_xpath(tree)
+                self.logger.debug(f"Found {len(elements)} potential item elements using CSS: '{item_selector}'")
+                # Page-level field matches, grouped per item below
+                fields_by_node: Dict[Any, List[str]] = {}
+                if elements:
+                    for field, field_xpath in self._css_field_xpaths.items():
+                        for node in field_xpath(tree):
+                            fields_by_node.setdefault(node, []).append(field)
             else: # Default to CSS selectors
-                soup = BeautifulSoup(html_content, self.bs_parser)
-                elements = soup.select(item_selector)
+                elements = self._compiled_item.select(tree)
                 self.logger.debug(f"Found {len(elements)} potential item elements using CSS: '{item_selector}'")
-
             if not elements:
                 self.logger.warning(f"No items found using {self.selector_type.upper()} selector '{item_selector}' on {url}.")
                 return items
 
+            # Checked once per page so per-item debug messages are not formatted when filtered out
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
             for i, element_context in enumerate(elements): # element_context is either BS4 Tag or lxml Element
+                if self.selector_type == 'xpath' and not hasattr(element_context, 'xpath'):
+                    self.logger.warning(f"XPath element type {type(element_context)} invalid for item {i+1}. Skipping item.")
+                    continue
+                if self._css_engine == 'lxml':
+                    element_context = self._group_css_matches(element_context, fields_by_node)
+
                 item_data = {}
-                for field, selector_config in field_selectors.items():
+                has_value = False
+                missing_required: Optional[str] = None
+                for field, current_selector, extractor in self._extraction_order:
                     value: Optional[str] = None
-                    current_selector: Optional[str] = None
-                    attr: Optional[str] = None
-
-                    if isinstance(selector_config, str):
-                        current_selector = selector_config
-                    elif isinstance(selector_config, dict):
-                        current_selector = selector_config.get('selector')
-                        attr = selector_config.get('attr')
-
-                    if not current_selector:
-                        self.logger.warning(f"Selector missing for field '{field}' in item {i+1}. Skipping field.")
-                        continue
-
                     try:
-                        if self.selector_type == 'xpath':
-                            if not hasattr(element_context, 'xpath'):
-                                 self.logger.warning(f"XPath element type {type(element_context)} invalid for item {i+1}, field {field}. Skipping field.")
-                                 continue
-
-                            # Handle relative XPaths (e.g. starting with .//)
-                            # lxml's element.xpath() handles this correctly by default.
-                            results = element_context.xpath(current_selector)
-
-                            if results:
-                                # XPath can return elements, text, attributes, or booleans/numbers.
-                                # We are primarily interested in text or attribute strings.
-                                first_result = results[0]
-
-                                if isinstance(first_result, etree._Element): # If XPath selected an element
-                                    if attr: # If config explicitly asks for an attribute
-                                        value = first_result.get(attr)
-                                    else: # Otherwise, get its text content
-                                        value = etree.tostring(first_result, method="text", encoding="unicode", with_tail=False).strip()
-                                elif hasattr(first_result, 'strip'): # If XPath directly returned a string (e.g., from text() or @attr)
-                                    value = str(first_result).strip()
-                                else: # Other types (e.g. boolean or number from an XPath function)
-                                    value = str(first_result)
-
-                                # If XPath selected multiple nodes but we only took the first,
-                                # and the user intended to get multiple (e.g. list of tags)
-                                # this simplified logic takes the first.
-                                # For multiple values (like tags), the selector itself should be designed
-                                # to return multiple strings or the processing rule should handle it.
-                                # For now, we focus on getting a single representative value.
-                                if len(results) > 1 and value is not None:
-                                    # If multiple text nodes or attributes were returned, concatenate them.
-                                    # This is common for selectors like ".//div/text()" which might return multiple text segments.
-                                    if all(isinstance(r, str) for r in results):
-                                        value = " ".join(r.strip() for r in results if r.strip()).strip()
-                                    elif all(isinstance(r, etree._Element) for r in results):
-                                        if attr:
-                                            value = ", ".join(r.get(attr, "").strip() for r in results if r.get(attr,"").strip()).strip()
-                                        else:
-                                            value = " ".join(etree.tostring(r, method="text", encoding="unicode", with_tail=False).strip() for r in results).strip()
-
-                        else: # CSS selector logic
-                             # element_context here is a BeautifulSoup Tag
-                             target_elements = element_context.select(current_selector) # Use select for potentially multiple
-                             if target_elements:
-                                 if attr:
-                                     value_list = [el.get(attr, "").strip() for el in target_elements if el.get(attr,"").strip()]
-                                     value = ", ".join(value_list) if value_list else None
-                                 else:
-                                     value_list = [el.get_text(strip=True) for el in target_elements if el.get_text(strip=True)]
-                                     value = " ".join(value_list) if value_list else None
-
-                        if attr in ['href', 'src'] and isinstance(value, str) and value:
-                            if not value.startswith(('http://', 'https://', '//', 'data:')):
-                                try: value = urljoin(url, value)
-                                except ValueError: self.logger.warning(f"Could not resolve relative URL '{value}' relative to base '{url}'.")
-                        elif isinstance(value, str):
-                            value = value.strip() if value else None # Ensure None if stripping results in empty
-
+                        value = extractor(element_context, url)
                     except etree.XPathEvalError as e:
                         self.logger.error(f"Invalid XPath expression '{current_selector}' for field '{field}' in item {i+1}: {e}")
                     except Exception as e:
                         self.logger.error(f"Unexpected error extracting field '{field}' with selector '{current_selector}' in item {i+1}: {e}")
 
+                    if value is None and field in self._required_fields:
+                        missing_required = field
+                        break
                     item_data[field] = value
+                    if value is not None:
+                        has_value = True
+
+                if missing_required:
+                    if debug_enabled: self.logger.debug(f"Skipping item {i+1} as required field '{missing_required}' evaluated to None.")
+                    continue
+                if self._required_fields: # Restore the configured field order
+                    item_data = {field: item_data[field] for field, _, _ in self._field_extractors}
 
-                if any(v is not None for v in item_data.values()):
+                if has_value:
                     items.append(item_data)
-                else:
+                elif debug_enabled:
                     self.logger.debug(f"Skipping item {i+1} as all fields evaluated to None.")
 
             if items: # Only log if non-empty items were actually successfully extracted
@@ -184,19 +692,95 @@ class HTMLScraper(BaseScraper):
                 self.logger.warning(f"Found {len(elements)} item elements, but all extracted items were empty on {url}.")
 
 
-        except etree.XMLSyntaxError as e:
-            self.logger.error(f"lxml failed to parse HTML for {url}: {e}")
-            return []
         except Exception as e:
             self.logger.error(f"Unexpected error during data extraction on {url}: {e}", exc_info=True)
             return []
 
         return items
 
+    @staticmethod
+    def _parse_simple_link_selector(selector: str) -> Optional[Tuple[str, str, bool]]:
+        """
+        Recognizes `a.<class>` and `a[<attr>=<value>]` CSS selectors.
+
+        Returns:
+            (attribute name, expected value, whether to match one word of a
+            space-separated list) or None if the selector needs a real CSS engine.
+        """
+        selector = selector.strip()
+        class_match = _SIMPLE_CLASS_SELECTOR_RE.match(selector)
+        if class_match:
+            return ('class', class_match.group(1), True)
+        attr_match = _SIMPLE_ATTR_SELECTOR_RE.match(selector)
+        if attr_match:
+            return (attr_match.group(1).lower(), attr_match.group(3), False)
+        return None
+
+    def _find_simple_link_href(self, html_content: str) -> Optional[str]:
+        """
+        Returns the href of the first <a> tag matching `self._simple_next_page_match`.
+
+        Mirrors `select_one(...).get('href')`: the first matching anchor wins
+        even if it has no href. Anchors inside comments, <script>, <style>,
+        <textarea> and <title> are ignored.
+        """
+        attr_name, expected, match_word = self._simple_next_page_match
+        for tag_match in _ANCHOR_TAG_RE.finditer(html_content):
+            anchor_tag = tag_match.group(2)
+            if anchor_tag is None: # Comment or raw-text/RCDATA element content
+                continue
+            attrs = {}
+            for name, dq_value, sq_value, bare_value in _TAG_ATTR_RE.findall(anchor_tag[1:]):
+                attrs.setdefault(name.lower(), unescape(dq_value or sq_value or bare_value))
+            value = attrs.get(attr_name)
+            if value is None:
+                continue
+            if (expected in value.split()) if match_word else (value == expected):
+                return attrs.get('href')
+        return None
+
     def _find_next_page_url(self, html_content: str, current_url: str) -> Optional[str]:
+        """
+        Finds the next page URL in raw HTML.
+
+        Simple CSS selectors are matched with regexes without building a tree;
+        everything else parses the page and delegates to `_next_page_from_tree`.
+        """
         if not self.pagination_config or not html_content:
             return None
 
+        if self._simple_next_page_match: # Simple CSS selector, matched on raw HTML
+            next_page_href = None
+            try:
+                next_page_href = self._find_simple_link_href(html_content)
+                if next_page_href: next_page_href = next_page_href.strip()
+                self.logger.debug(f"Raw HTML match for pagination found href: {next_page_href}")
+            except Exception as e:
+                self.logger.error(f"Error processing next page selector '{self.pagination_config.get('next_page_selector')}' (type: {self.selector_type.upper()}): {e}", exc_info=True)
+            return self._resolve_next_page_href(next_page_href, current_url)
+
+        tree = self._parse_html(html_content, current_url)
+        if tree is None:
+            return None
+        return self._next_page_from_tree(tree, current_url)
+
+    def _resolve_next_page_href(self, next_page_href: Optional[str], current_url: str) -> Optional[str]:
+        """Resolves a next-page href against the current URL, refusing self-links."""
+        if not next_page_href: # Ensure href is not empty after stripping
+            return None
+        resolved_url = _resolve_url(current_url, next_page_href)
+        if resolved_url == current_url:
+            self.logger.warning(f"Next page URL '{resolved_url}' is same as current. Stopping pagination to prevent loop.")
+            return None
+        return resolved_url
+
+    def _next_page_from_tree(self, tree: Any, current_url: str) -> Optional[str]:
+        """
+        Finds the next page URL in a page already parsed by `_parse_html`.
+        """
+        if not self.pagination_config:
+            return None
+
         next_page_selector = self.pagination_config.get('next_page_selector')
         if not next_page_selector:
             self.logger.debug("Pagination enabled in config, but 'next_page_selector' is missing.")
@@ -207,19 +791,10 @@ class HTMLScraper(BaseScraper):
 
         try:
             if self.selector_type == 'xpath':
-                if not LXML_INSTALLED:
-                    self.logger.error("LXML is required for XPath based pagination but not installed.")
-                    return None
-
-                parser = etree.HTMLParser(recover=True)
-                tree = lxml_html.fromstring(html_content.encode('utf-8', 'replace'), parser=parser)
-                if tree is None:
-                    self.logger.error(f"lxml failed to parse HTML for pagination from {current_url}")
-                    return None
-
+                evaluate = self._next_page_xpath or (lambda t: t.xpath(next_page_selector))
                 # Case 1: XPath selector is for the href attribute directly (e.g., ".../@href")
                 if "/@" in next_page_selector:
-                    results = tree.xpath(next_page_selector) # lxml xpath can return attribute values as strings
+                    results = evaluate(tree) # lxml xpath can return attribute values as strings
                     if results and isinstance(results, list) and len(results) > 0 and isinstance(results[0], str):
                         next_page_href = results[0].strip()
                         self.logger.debug(f"XPath (attribute) evaluation for pagination found href: {next_page_href}")
@@ -227,26 +802,26 @@ class HTMLScraper(BaseScraper):
                          self.logger.warning(f"XPath for pagination attribute selector did not return a string as expected. Selector: {next_page_selector}, Got: {results[0]}")
                 else:
                     # Case 2: XPath selector is for the <a> element
-                    elements = tree.xpath(next_page_selector)
+                    elements = evaluate(tree)
                     if elements and hasattr(elements[0], 'get'):
                         next_page_href = elements[0].get("href")
                         if next_page_href: next_page_href = next_page_href.strip()
                         self.logger.debug(f"XPath (element) evaluation for pagination found href: {next_page_href}")
 
-            else: # CSS Selector
-                soup = BeautifulSoup(html_content, self.bs_parser)
-                link_element = soup.select_one(next_page_selector)
-                if link_element:
-                    next_page_href = link_element.get("href")
-                    if next_page_href: next_page_href = next_page_href.strip()
-                    self.logger.debug(f"CSS evaluation for pagination found href: {next_page_href}")
-
-            if next_page_href: # Ensure href is not empty after stripping
-                resolved_url = urljoin(current_url, next_page_href)
-                if resolved_url == current_url:
-                    self.logger.warning(f"Next page URL '{resolved_url}' is same as current. Stopping pagination to prevent loop.")
-                    return None
-                return resolved_url
+            else: # CSS Selector, on whichever tree the CSS engine uses
+                if self._css_engine == 'lexbor':
+                    link_node = tree.css_first(next_page_selector)
+                    next_page_href = link_node.attributes.get("href") if link_node else None
+                elif self._css_engine == 'lxml':
+                    link_elements = self._css_next_xpath(tree)
+                    next_page_href = link_elements[0].get("href") if link_elements else None
+                else:
+                    link_element = self._compiled_next.select_one(tree)
+                    next_page_href = link_element.get("href") if link_element else None
+                if next_page_href: next_page_href = next_page_href.strip()
+                self.logger.debug(f"CSS evaluation for pagination found href: {next_page_href}")
+
+            return self._resolve_next_page_href(next_page_href, current_url)
 
         except etree.XPathEvalError as e_xpath:
              self.logger.error(f"Invalid XPath expression for pagination '{next_page_selector}': {e_xpath}")
@@ -256,10 +831,8 @@ class HTMLScraper(BaseScraper):
         return None
 
 
-    def run(self) -> Dict:
-        self.stats['start_time'] = time.time()
-        all_extracted_data: List[Dict] = []
-
+    def _initial_urls(self) -> List[str]:
+        """Returns the seed URLs from the config as a list."""
         initial_urls = self.config.get("urls", [])
         if isinstance(initial_urls, str): # Handle single URL string
             urls_to_scrape: List[str] = [initial_urls]
@@ -268,9 +841,12 @@ class HTMLScraper(BaseScraper):
         else:
             self.logger.error(f"URLs in config are not a list or string: {initial_urls}")
             urls_to_scrape = []
+        if not urls_to_scrape:
+            self.logger.warning("No initial URLs provided in configuration.")
+        return urls_to_scrape
 
-        scraped_urls: Set[str] = set()
-
+    def _max_pages(self) -> float:
+        """Returns the pagination page limit, or infinity if unlimited."""
         max_pages = float('inf')
         if self.pagination_config:
             max_pages_config = self.pagination_config.get('max_pages')
@@ -278,54 +854,139 @@ class HTMLScraper(BaseScraper):
                 max_pages = int(max_pages_config)
             elif max_pages_config is not None: # If it's set but not a valid number
                  self.logger.warning(f"Invalid 'max_pages' value '{max_pages_config}'. Defaulting to unlimited.")
+        return max_pages
 
+    def _fetch_document(self, url: str) -> Optional[Tuple[Union[str, bytes], Optional[str]]]:
+        """
+        Fetches a page in the form its parser takes: (raw bytes, encoding) for
+        lxml, so the body is decoded only once by libxml2, and (text, None) otherwise.
+        """
+        if self._parses_with_lxml:
+            return self.fetch_page_bytes(url)
+        html_content = self.fetch_page(url)
+        return (html_content, None) if html_content else None
 
-        pages_scraped_this_run = 0
-
-        if not urls_to_scrape:
-            self.logger.warning("No initial URLs provided in configuration.")
-
-        queue_idx = 0
-        while queue_idx < len(urls_to_scrape) and pages_scraped_this_run < max_pages:
-            current_url = urls_to_scrape[queue_idx]
-            queue_idx += 1
+    def _scrape_fetched_page(self, html_content: Union[str, bytes], current_url: str, find_next: bool,
+                             encoding: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Extracts items and, if `find_next`, the next page URL from a fetched page.
+        The page is parsed once; extraction and pagination share the tree.
 
-            if current_url in scraped_urls:
-                self.logger.debug(f"Skipping already scraped URL: {current_url}")
-                continue
+        With `extract_cache_size` > 0, results for byte-identical content at the
+        same URL are served from an LRU cache without parsing.
+        """
+        cache_key = None
+        if self.extract_cache_size:
+            raw = html_content.encode('utf-8') if isinstance(html_content, str) else html_content
+            cache_key = (hashlib.blake2b(raw, digest_size=16).digest(), current_url, self._selectors_fingerprint)
+            with _EXTRACT_CACHE_LOCK:
+                cached = _EXTRACT_CACHE.get(cache_key)
+                if cached is not None:
+                    _EXTRACT_CACHE.move_to_end(cache_key)
+            if cached is not None:
+                self.logger.debug(f"Extraction cache hit for {current_url}")
+                page_data, next_page_url = cached
+                return [dict(item) for item in page_data], (next_page_url if find_next else None)
+
+        tree = self._parse_html(html_content, current_url, encoding)
+        if tree is None:
+            return [], None
+        page_data = self._extract_from_tree(tree, current_url)
+        next_page_url = None
+        if find_next or cache_key: # Cache entries always record the next page
+            if self._item_strainer is not None: # Strained tree has no pagination links; match the raw HTML
+                next_page_url = self._find_next_page_url(html_content, current_url)
+            else:
+                next_page_url = self._next_page_from_tree(tree, current_url)
+            if find_next and not next_page_url:
+                self.logger.info("No further pages found for this URL branch based on pagination rules.")
+                # Don't break the main loop if there are other initial URLs or branches
+
+        if cache_key:
+            with _EXTRACT_CACHE_LOCK:
+                _EXTRACT_CACHE[cache_key] = ([dict(item) for item in page_data], next_page_url)
+                while len(_EXTRACT_CACHE) > self.extract_cache_size:
+                    _EXTRACT_CACHE.popitem(last=False)
+        return page_data, (next_page_url if find_next else None)
+
+    def _enqueue_next_page(self, next_page_url: str, urls_to_scrape: Deque[str], queued_urls: Set[str], scraped_urls: Set[str]) -> None:
+        """Appends a discovered next page to the frontier unless already visited or queued."""
+        if next_page_url not in scraped_urls and next_page_url not in queued_urls:
+            self.logger.info(f"Adding next page to queue: {next_page_url}")
+            urls_to_scrape.append(next_page_url)
+            queued_urls.add(next_page_url)
+        else:
+            self.logger.debug(f"Next page URL '{next_page_url}' already visited or queued.")
 
-            self.logger.info(f"Processing URL ({pages_scraped_this_run + 1}/{max_pages if max_pages != float('inf') else 'all available'}): {current_url}")
-            html_content = self.fetch_page(current_url) # Uses BaseScraper's fetch_page
-            scraped_urls.add(current_url)
+    def run(self) -> Dict:
+        """
+        Executes the scraping job over the seed URLs and their pagination.
+
+        The frontier is processed in waves of up to `max_concurrency` URLs, taken
+        from the queue in order. With `max_concurrency` > 1 a wave is fetched
+        concurrently with `_fetch_document` on a thread pool of that size; items
+        are then extracted and discovered next pages queued in wave order on the
+        calling thread. A wave of one is fetched directly, without the pool.
+        robots.txt checks, throttling, proxy rotation and retries all still go
+        through `fetch_page`.
+        """
+        self.stats['start_time'] = time.time()
+        all_extracted_data = self._new_result_sink()
+        # BFS frontier; queued_urls mirrors its contents for O(1) membership checks
+        urls_to_scrape: Deque[str] = deque(self._initial_urls())
+        queued_urls: Set[str] = set(urls_to_scrape)
+        scraped_urls: Set[str] = set()
+        max_pages = self._max_pages()
+        pages_scraped_this_run = 0
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="fetch") if self.max_concurrency > 1 else None
 
-            if html_content:
-                page_data = self.extract_data(html_content, current_url)
-                if page_data: # Only extend if data was actually extracted
-                    all_extracted_data.extend(page_data)
+        try:
+            while urls_to_scrape and pages_scraped_this_run < max_pages:
+                # Never fetch more pages than max_pages still allows
+                wave_size = min(self.max_concurrency, max_pages - pages_scraped_this_run)
+                wave: List[str] = []
+                while urls_to_scrape and len(wave) < wave_size:
+                    current_url = urls_to_scrape.popleft()
+                    queued_urls.discard(current_url)
+                    if current_url in scraped_urls or current_url in wave:
+                        self.logger.debug(f"Skipping already scraped URL: {current_url}")
+                        continue
+                    wave.append(current_url)
+                if not wave:
+                    break
 
-                # self.stats['pages_scraped'] is incremented by fetch_page on success
-                # We need a separate counter for pagination max_pages logic
-                pages_scraped_this_run += 1
+                if len(wave) == 1:
+                    self.logger.info(f"Processing URL ({pages_scraped_this_run + 1}/{max_pages if max_pages != float('inf') else 'all available'}): {wave[0]}")
+                    pages = [self._fetch_document(wave[0])] # Uses BaseScraper's fetch_page(_bytes)
+                else:
+                    self.logger.info(f"Fetching {len(wave)} URL(s) concurrently ({pages_scraped_this_run} pages scraped so far): {wave}")
+                    pages = list(executor.map(self._fetch_document, wave))
+                scraped_urls.update(wave)
 
-                if pages_scraped_this_run < max_pages:
-                    next_page_url = self._find_next_page_url(html_content, current_url)
+                for current_url, fetched in zip(wave, pages):
+                    if not (fetched and fetched[0]):
+                        self.logger.warning(f"No content fetched for {current_url}. Cannot extract data or find next page.")
+                        continue
+                    html_content, encoding = fetched
+                    # self.stats['pages_scraped'] is incremented by fetch_page on success;
+                    # this separate counter drives the max_pages limit
+                    pages_scraped_this_run += 1
+                    page_data, next_page_url = self._scrape_fetched_page(html_content, current_url, pages_scraped_this_run < max_pages, encoding)
+                    if page_data: # Only extend if data was actually extracted
+                        all_extracted_data.extend(page_data)
                     if next_page_url:
-                        if next_page_url not in scraped_urls and next_page_url not in urls_to_scrape:
-                            self.logger.info(f"Adding next page to queue: {next_page_url}")
-                            urls_to_scrape.append(next_page_url)
-                        else:
-                            self.logger.debug(f"Next page URL '{next_page_url}' already visited or queued.")
-                    else:
-                        self.logger.info("No further pages found for this URL branch based on pagination rules.")
-                        # Don't break the main loop if there are other initial URLs or branches
-            else:
-                self.logger.warning(f"No content fetched for {current_url}. Cannot extract data or find next page.")
-
-
-            if pages_scraped_this_run >= max_pages:
-                self.logger.info(f"Reached maximum page limit ({max_pages}). Stopping further pagination.")
-                break
-
+                        self._enqueue_next_page(next_page_url, urls_to_scrape, queued_urls, scraped_urls)
+
+                if pages_scraped_this_run >= max_pages:
+                    self.logger.info(f"Reached maximum page limit ({max_pages}). Stopping further pagination.")
+                    break
+        except BaseException:
+            self._abandon_result_sink(all_extracted_data)
+            raise
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            self.close() # Release pooled connections, also if a page raised
         processed_data = self._process_extracted_data(all_extracted_data) # Uses BaseScraper's method
         self.stats['end_time'] = time.time()
-        return {'data': processed_data, 'stats': self.get_stats(), 'config': self.config}
+        return self._build_result(processed_data)
@@ -2,7 +2,7 @@
 CSV storage implementation.
 """
 
-import pandas as pd
+import csv
 import time
 from pathlib import Path
 from typing import List, Dict
@@ -29,7 +29,8 @@ class CSVStorage(BaseStorage):
                 # Attempt to get headers from config if data is empty
                 headers = list(self.config.get('selectors', {}).get('fields', {}).keys())
                 if headers:
-                    pd.DataFrame(columns=headers).to_csv(filepath, index=False, encoding='utf-8')
+                    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                        csv.DictWriter(f, fieldnames=headers, lineterminator='\n').writeheader()
                     self.logger.info(f"Empty CSV with headers saved to {filepath}")
                 else:
                     # Create a completely empty file
@@ -41,10 +42,11 @@ class CSVStorage(BaseStorage):
                  raise
 
         try:
-            df = pd.DataFrame(data)
-            # Ensure consistent column order based on the first item's keys
-            df = df[list(data[0].keys())]
-            df.to_csv(filepath, index=False, encoding='utf-8')
+            # Columns follow the first item's keys; keys it lacks are dropped, missing values left empty
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                writer = csv.DictWriter(f, fieldnames=list(data[0].keys()), extrasaction='ignore', lineterminator='\n')
+                writer.writeheader()
+                writer.writerows(data)
             self.logger.info(f"Data saved to {filepath}")
             return str(filepath)
         except Exception as e:
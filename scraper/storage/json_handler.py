@@ -4,6 +4,12 @@ from pathlib import Path
 from typing import List, Dict
 from .base_storage import BaseStorage
 import logging
+# --- Import orjson (optional, much faster serialization) ---
+try:
+    import orjson
+    ORJSON_INSTALLED = True
+except ImportError:
+    ORJSON_INSTALLED = False
 
 class JSONStorage(BaseStorage):
     """JSON file storage handler."""
@@ -19,8 +25,18 @@ class JSONStorage(BaseStorage):
         filepath = self.output_dir / filename
 
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            payload = None
+            if ORJSON_INSTALLED:
+                try:
+                    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                except orjson.JSONEncodeError as e: # e.g. integers beyond 64 bits; the json module handles those
+                    self.logger.debug(f"orjson could not serialize data ({e}); falling back to json module.")
+            if payload is not None:
+                with open(filepath, 'wb') as f:
+                    f.write(payload)
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
             self.logger.info(f"Data saved to {filepath}")
             return str(filepath)
         except Exception as e:
@@ -2,6 +2,7 @@
 SQLite storage implementation.
 """
 
+import json
 import sqlite3
 from pathlib import Path
 from typing import List, Dict, Any # Added Any import back for _sql_type_for_value
@@ -9,6 +10,22 @@ from .base_storage import BaseStorage
 import logging
 from datetime import datetime, date # Added date import back
 
+# SQLite column type per Python type, looked up along the value's MRO (bool before int,
+# datetime before date). Lists, dicts and anything else are stored as TEXT (JSON strings).
+_SQL_TYPE_MAP = {
+    bool: 'INTEGER', # Store bools as 0 or 1
+    int: 'INTEGER',
+    float: 'REAL',
+    datetime: 'TIMESTAMP', # Relies on detect_types for conversion
+    date: 'TIMESTAMP',
+    str: 'TEXT',
+    bytes: 'TEXT',
+    type(None): 'TEXT', # Default type for None, can be overridden if needed
+}
+
+# Values of these exact types are bound as-is (see _prepare_value); bool is a separate type
+_PASSTHROUGH_TYPES = frozenset((str, int, float, bytes, type(None)))
+
 class SQLiteStorage(BaseStorage):
     """SQLite database storage handler."""
 
@@ -39,7 +56,15 @@ class SQLiteStorage(BaseStorage):
             db_path.parent.mkdir(parents=True, exist_ok=True)
 
             conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+            # Bulk-insert tuning: everything below runs in one transaction, so synchronous=NORMAL
+            # and in-memory temp b-trees cover most of the gain. The rollback journal is kept
+            # (journal_mode is stored in the file) so the exported .db opens anywhere without
+            # -wal/-shm side files. Must be set outside a transaction.
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
             cursor = conn.cursor()
+            cursor.execute("BEGIN") # Schema changes and inserts commit (or roll back) together
 
             # Create table if not exists
             # Use the keys from the first data item for column definition
@@ -72,17 +97,18 @@ class SQLiteStorage(BaseStorage):
 
             # Insert data
             # Use dict keys for column names for robustness
-            columns = ['"{}"'.format(k) for k in sample_item.keys()] # Quote column names
+            keys = tuple(sample_item.keys())
+            columns = ['"{}"'.format(k) for k in keys] # Quote column names
             placeholders = ', '.join(['?'] * len(columns))
             insert_sql = f'INSERT INTO "{self.table_name}" ({", ".join(columns)}) VALUES ({placeholders})'
 
-            # Prepare data for executemany
-            data_to_insert = []
-            for item in data:
-                 # Ensure item has all keys from sample_item, filling missing with None
-                 row_values = [self._prepare_value(item.get(key)) for key in sample_item.keys()]
-                 data_to_insert.append(tuple(row_values))
-
+            # Rows are produced lazily for executemany rather than materialized as a second list.
+            # Missing keys are filled with None.
+            prepare = self._prepare_value
+            data_to_insert = (
+                tuple([value if type(value) in _PASSTHROUGH_TYPES else prepare(value) for value in map(item.get, keys)])
+                for item in data
+            )
 
             cursor.executemany(insert_sql, data_to_insert)
 
@@ -110,25 +136,11 @@ class SQLiteStorage(BaseStorage):
 
     def _sql_type_for_value(self, value: Any) -> str:
         """Determine appropriate SQLite type for Python value."""
-        # Order matters: check bool before int
-        if isinstance(value, bool):
-            return 'INTEGER' # Store bools as 0 or 1
-        elif isinstance(value, int):
-            return 'INTEGER'
-        elif isinstance(value, float):
-            return 'REAL'
-        elif isinstance(value, (datetime, date)):
-             # Store timestamps/dates as ISO format strings (TEXT is safer across DBs)
-             # Or use native TIMESTAMP type if detect_types is enabled
-             return 'TIMESTAMP' # Relies on detect_types for conversion
-             # return 'TEXT'
-        elif isinstance(value, (str, bytes)):
-            return 'TEXT'
-        elif value is None:
-             return 'TEXT' # Default type for None, can be overridden if needed
-        else:
-            # For lists, dicts, etc., store as JSON strings
-            return 'TEXT' # Store complex types as TEXT (e.g., JSON string)
+        for cls in type(value).__mro__:
+            sql_type = _SQL_TYPE_MAP.get(cls)
+            if sql_type:
+                return sql_type
+        return 'TEXT' # Store complex types as TEXT (e.g., JSON string)
 
 
     def _prepare_value(self, value: Any) -> Any:
@@ -141,7 +153,6 @@ class SQLiteStorage(BaseStorage):
             return 1 if value else 0 # Store bools as 1 or 0
         elif isinstance(value, (list, dict)):
             # Store lists/dicts as JSON strings
-            import json
             return json.dumps(value)
         elif value is None:
              return None # Keep None as SQL NULL
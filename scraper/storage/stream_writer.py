@@ -0,0 +1,85 @@
+"""
+Incremental JSON Lines writer used to stream scraped items to disk.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List
+
+
+class StreamingWriter:
+    """
+    Appends items to a JSON Lines file as they are produced.
+
+    Used by the scrapers when `streaming: true` is set in the config, so that
+    memory stays flat regardless of crawl size. Exposes `extend()` so it can
+    stand in for the in-memory result list inside `run()` loops.
+    """
+
+    def __init__(self, filepath: Path):
+        """
+        Opens `filepath` for writing, creating parent directories as needed.
+
+        Args:
+            filepath: Destination `.jsonl` file. Existing content is overwritten.
+        """
+        self.filepath = Path(filepath)
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger(__name__)
+        self.count = 0
+        self._file = open(self.filepath, 'w', encoding='utf-8')
+
+    def write_all(self, items: Iterable[Dict]) -> None:
+        """Serializes each item as one JSON line."""
+        for item in items:
+            self._file.write(json.dumps(item, ensure_ascii=False, default=str))
+            self._file.write('\n')
+            self.count += 1
+
+    extend = write_all # Drop-in for list.extend in run() loops
+
+    def close(self) -> None:
+        """Flushes and closes the underlying file. Safe to call more than once."""
+        if not self._file.closed:
+            self._file.close()
+
+    def iter_chunks(self, chunk_size: int = 1000) -> Iterator[List[Dict]]:
+        """
+        Reads the written items back in lists of at most `chunk_size` items.
+
+        Closes the writer first so all buffered lines are visible.
+        """
+        self.close()
+        chunk: List[Dict] = []
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                chunk.append(json.loads(line))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> "StreamingWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def read_jsonl_head(filepath: Path, limit: int = 10) -> List[Dict]:
+    """Returns the first `limit` items of a JSON Lines file, e.g. for result previews."""
+    items: List[Dict] = []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            if len(items) >= limit:
+                break
+            if line.strip():
+                items.append(json.loads(line))
+    return items
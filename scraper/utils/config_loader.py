@@ -1,8 +1,25 @@
+import copy
+import os
 import yaml
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+# --- YAML loader/dumper: libyaml C bindings when PyYAML was built with them ---
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+# --- Import fastjsonschema (optional, code-generated validator for the fast path) ---
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_INSTALLED = True
+except ImportError:
+    FASTJSONSCHEMA_INSTALLED = False
 
 # --- API Config Schema ---
 API_CONFIG_SCHEMA = {
@@ -68,7 +85,9 @@ WEB_SELECTORS_SCHEMA = {
                         "type": "object",
                         "properties": {
                             "selector": {"type": "string", "description": "Selector for the field's element."},
-                            "attr": {"type": "string", "description": "(Optional) Attribute to extract (e.g., 'href', 'src'). Extracts text if omitted."}
+                            "attr": {"type": "string", "description": "(Optional) Attribute to extract (e.g., 'href', 'src'). Extracts text if omitted."},
+                            "required": {"type": "boolean", "default": False, "description": "(Optional, static HTML) Skip items where this field is empty, without evaluating the other fields."},
+                            "first": {"type": "boolean", "default": False, "description": "(Optional, XPath) Use only the first match instead of joining all matches."}
                         },
                         "required": ["selector"],
                         "additionalProperties": False
@@ -97,8 +116,8 @@ WEB_PAGINATION_SCHEMA = {
 PROXY_ITEM_SCHEMA = {
     "type": "object",
     "properties": {
-        "http": {"type": "string", "format": "uri", "pattern": r"^http(s)?://"},
-        "https": {"type": "string", "format": "uri", "pattern": r"^http(s)?://"}
+        "http": {"type": "string", "format": "uri", "pattern": r"^https?://"},
+        "https": {"type": "string", "format": "uri", "pattern": r"^https?://"}
     },
     "anyOf": [
         {"required": ["http"]},
@@ -206,6 +225,13 @@ PROCESSING_RULES_SCHEMA = {
     "additionalProperties": False # No other keys allowed directly under processing_rules
 }
 
+# --- Loaded Config Cache ---
+# realpath -> ((mtime_ns, size), validated config). A file is re-read only when its
+# modification time or size changes; callers always get their own deep copy.
+_CONFIG_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_CONFIG_CACHE_LOCK = threading.Lock()
+_CONFIG_CACHE_SIZE = 64
+
 # --- ConfigLoader Class ---
 
 class ConfigLoader:
@@ -234,6 +260,7 @@ class ConfigLoader:
             "disable_images": {"type": "boolean", "default": True, "description": "Disable image loading (dynamic only)"},
             "page_load_timeout": {"type": "integer", "minimum": 5, "default": 30, "description": "Timeout for page loads (dynamic only)"},
             "wait_time": {"type": "number", "minimum": 0, "default": 5, "description": "General wait time after page load/action (dynamic only)"},
+            "reuse_driver": {"type": "boolean", "default": False, "description": "Keep the browser open after the job and reuse it for later jobs in this process launched with the same options (dynamic only)"},
             "login_config": LOGIN_CONFIG_SCHEMA, # Schema defined above
 
             # --- API Specific ---
@@ -242,6 +269,7 @@ class ConfigLoader:
             # --- Common / General ---
             "processing_rules": PROCESSING_RULES_SCHEMA, # Schema defined above
             "output_dir": {"type": "string", "default": "outputs", "description": "Base directory for output files"},
+            "streaming": {"type": "boolean", "default": False, "description": "Stream extracted items to a JSON Lines file under output_dir instead of holding them in memory"},
             "output_format": {
                 "type": "string",
                 "enum": ["csv", "json", "sqlite"],
@@ -250,6 +278,9 @@ class ConfigLoader:
             },
             "request_delay": {"type": "number", "minimum": 0, "default": 1, "description": "Delay in seconds between requests"},
             "max_retries": {"type": "integer", "minimum": 0, "default": 3, "description": "Max retries on failed requests"},
+            "extract_cache_size": {"type": "integer", "minimum": 0, "default": 0, "description": "Pages whose extraction results are memoized by content hash and URL (web scraping only; 0 = off)"},
+            "max_concurrency": {"type": "integer", "minimum": 1, "default": 1, "description": "Pages fetched in parallel per pagination wave (web scraping only; 1 = sequential)"},
+            "http2": {"type": "boolean", "default": False, "description": "Fetch pages over a persistent HTTP/2 connection (requires httpx[http2]; proxied requests still use requests)"},
             "user_agent": {"type": "string", "description": "Custom User-Agent string"},
             "respect_robots": {"type": "boolean", "default": True, "description": "Whether to obey robots.txt rules (web only)"},
             "proxies": { "type": "array", "items": PROXY_ITEM_SCHEMA, "default": [], "description": "List of proxies to use"}
@@ -269,6 +300,47 @@ class ConfigLoader:
     }
     # --- End Main Config Schema ---
 
+    # Validator for CONFIG_SCHEMA, built on first use and shared by all instances
+    _VALIDATOR = None
+    _VALIDATOR_LOCK = threading.Lock()
+    # fastjsonschema function for CONFIG_SCHEMA; False once compilation was tried and failed
+    _FAST_VALIDATE = None
+
+    @classmethod
+    def _get_validator(cls):
+        """
+        Returns the cached validator for `CONFIG_SCHEMA`.
+
+        `jsonschema.validate()` re-checks the schema and builds a new validator on
+        every call; this does both once per process.
+        """
+        if cls._VALIDATOR is None:
+            with cls._VALIDATOR_LOCK:
+                if cls._VALIDATOR is None:
+                    validator_cls = validator_for(cls.CONFIG_SCHEMA)
+                    validator_cls.check_schema(cls.CONFIG_SCHEMA)
+                    cls._VALIDATOR = validator_cls(cls.CONFIG_SCHEMA)
+        return cls._VALIDATOR
+
+    @classmethod
+    def _get_fast_validate(cls):
+        """
+        Returns a fastjsonschema function compiled from `CONFIG_SCHEMA`, or None.
+
+        The generated code is several times faster than jsonschema's interpreter,
+        so it screens configs first; jsonschema is only consulted when it
+        reports a problem.
+        """
+        if cls._FAST_VALIDATE is None:
+            with cls._VALIDATOR_LOCK:
+                if cls._FAST_VALIDATE is None:
+                    try:
+                        # use_default=False: the generated code must not write schema defaults into the checked config
+                        cls._FAST_VALIDATE = fastjsonschema.compile(cls.CONFIG_SCHEMA, use_default=False) if FASTJSONSCHEMA_INSTALLED else False
+                    except Exception as e: # Unsupported construct; jsonschema alone still validates
+                        logging.getLogger(__name__).debug(f"fastjsonschema could not compile the config schema: {e}")
+                        cls._FAST_VALIDATE = False
+        return cls._FAST_VALIDATE or None
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -276,10 +348,24 @@ class ConfigLoader:
     def load_config(self, config_path: str) -> Dict[str, Any]:
         config = {}
         try:
+            st = os.stat(config_path)
+            cache_key, stamp = os.path.realpath(config_path), (st.st_mtime_ns, st.st_size)
+            with _CONFIG_CACHE_LOCK:
+                cached = _CONFIG_CACHE.get(cache_key)
+                if cached is not None and cached[0] == stamp:
+                    _CONFIG_CACHE.move_to_end(cache_key)
+                    self.logger.debug(f"Configuration unchanged since last load, using cached copy: {config_path}")
+                    return copy.deepcopy(cached[1])
+
             config = self._load_yaml(config_path)
             config.setdefault('job_type', 'web'); config.setdefault('proxies', [])
             self.validate_config(config)
             self.logger.info(f"Configuration loaded and validated: {config_path}")
+            with _CONFIG_CACHE_LOCK:
+                _CONFIG_CACHE[cache_key] = (stamp, copy.deepcopy(config))
+                _CONFIG_CACHE.move_to_end(cache_key)
+                while len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+                    _CONFIG_CACHE.popitem(last=False)
             return config
         except FileNotFoundError: self.logger.error(f"Config file not found: {config_path}"); raise
         except yaml.YAMLError as e: self.logger.error(f"Error parsing YAML {config_path}: {e}"); raise
@@ -288,10 +374,27 @@ class ConfigLoader:
 
     def _load_yaml(self, file_path: str) -> Dict[str, Any]:
         with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=_SafeLoader) or {}
+
+    def _passes_fast_validation(self, config: Dict[str, Any]) -> bool:
+        """True if the fastjsonschema validator is available and accepts `config`."""
+        fast_validate = self._get_fast_validate()
+        if fast_validate is None:
+            return False
+        try:
+            fast_validate(config)
+            return True
+        except Exception: # Any complaint is re-checked by jsonschema, which has the final say
+            return False
 
     def validate_config(self, config: Dict[str, Any]) -> bool:
-        validate(instance=config, schema=self.CONFIG_SCHEMA)
+        # jsonschema runs only when the fast path is unavailable or objects: it produces the
+        # error callers expect (path, message) and accepts what fastjsonschema's stricter
+        # format checks (e.g. 'uri') reject
+        if not self._passes_fast_validation(config):
+            error = best_match(self._get_validator().iter_errors(config)) # Same error jsonschema.validate() would raise
+            if error is not None:
+                raise error
         if 'login_config' in config and not config.get('dynamic', False):
              self.logger.warning("login_config is present but 'dynamic' is not true. Login will be ignored.")
         # Add specific checks for selector types if needed (e.g., XPath vs CSS)
@@ -316,7 +419,7 @@ class ConfigLoader:
         sample_config_dir = Path("configs") / "generated_samples"
         try:
             sample_config_dir.mkdir(parents=True, exist_ok=True)
-            self.logger.info(f"Ensured sample config directory exists: {sample_config_dir.resolve()}")
+            self.logger.info(f"Ensured sample config directory exists: {sample_config_dir.absolute()}")
         except OSError as e:
             self.logger.error(f"Error creating sample config directory {sample_config_dir}: {e}")
             # Fallback to current directory if creation fails
@@ -409,17 +512,19 @@ class ConfigLoader:
         generated_files = []
         try:
             with open(web_config_path, 'w', encoding='utf-8') as f_web:
-                yaml.dump(sample_config_web, f_web, sort_keys=False, default_flow_style=False, allow_unicode=True)
-            self.logger.info(f"Generated sample web config: {web_config_path.resolve()}")
-            generated_files.append(str(web_config_path.resolve()))
+                yaml.dump(sample_config_web, f_web, Dumper=_SafeDumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
+            written_path = str(web_config_path.absolute())
+            self.logger.info(f"Generated sample web config: {written_path}")
+            generated_files.append(written_path)
         except Exception as e:
             self.logger.error(f"Error writing sample web config to {web_config_path}: {e}")
 
         try:
             with open(api_config_path, 'w', encoding='utf-8') as f_api:
-                yaml.dump(api_sample, f_api, sort_keys=False, default_flow_style=False, allow_unicode=True)
-            self.logger.info(f"Generated sample API config: {api_config_path.resolve()}")
-            generated_files.append(str(api_config_path.resolve()))
+                yaml.dump(api_sample, f_api, Dumper=_SafeDumper, sort_keys=False, default_flow_style=False, allow_unicode=True)
+            written_path = str(api_config_path.absolute())
+            self.logger.info(f"Generated sample API config: {written_path}")
+            generated_files.append(written_path)
         except Exception as e:
             self.logger.error(f"Error writing sample API config to {api_config_path}: {e}")
 
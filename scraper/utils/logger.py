@@ -12,6 +12,10 @@ from typing import Optional
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 LOGS_DIR = PROJECT_ROOT / 'logs'
 
+# Settings and handlers from the last setup_logging() call, so reruns with the
+# same arguments (e.g. Streamlit script reruns) don't reopen the log file
+_LAST_SETUP: Optional[tuple] = None
+
 def setup_logging(
     log_filename: Optional[str] = 'scraper.log', # Default filename within logs dir
     log_dir: Path = LOGS_DIR, # Use the defined logs directory
@@ -21,12 +25,18 @@ def setup_logging(
     console_level: Optional[int] = None # Allow different level for console
 ) -> None:
     """Configure logging for the application."""
+    global _LAST_SETUP
+    root_logger = logging.getLogger()
+    setup_key = (log_filename, str(log_dir), max_bytes, backup_count, level, console_level, sys.stdout)
+    if (_LAST_SETUP is not None and _LAST_SETUP[0] == setup_key
+            and root_logger.handlers == list(_LAST_SETUP[1])):
+        return
+
     log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S' # Added date format
     formatter = logging.Formatter(log_format, datefmt=date_format)
 
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(min(level, console_level or level)) # Set root logger to lowest level needed
 
     # Remove existing handlers to avoid duplicate logs
@@ -46,7 +56,8 @@ def setup_logging(
     # File handler if log filename specified
     if log_filename:
         # Ensure the log directory exists
-        log_dir.mkdir(parents=True, exist_ok=True)
+        if not log_dir.is_dir():
+            log_dir.mkdir(parents=True, exist_ok=True)
         log_path = log_dir / log_filename
 
         file_handler = RotatingFileHandler(
@@ -62,6 +73,8 @@ def setup_logging(
     else:
          logging.info("Logging setup complete. Console handler only.")
 
+    _LAST_SETUP = (setup_key, tuple(root_logger.handlers))
+
 
 # --- LoggingMixin remains the same ---
 class LoggingMixin:
@@ -69,8 +82,6 @@ class LoggingMixin:
     @property
     def logger(self):
         """Return a logger named for the current class."""
-        # Use self.__module__ + '.' + self.__class__.__name__ for more specific logger names
-        logger_name = f"{self.__module__}.{self.__class__.__name__}"
-        if not hasattr(self, '_logger'):
-            self._logger = logging.getLogger(logger_name)
-        return self._logger
+        # logging.getLogger already caches loggers by name, so nothing is
+        # stored on the instance (keeps subclasses usable with __slots__)
+        return logging.getLogger(f"{self.__module__}.{type(self).__name__}")
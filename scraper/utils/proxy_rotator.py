@@ -3,6 +3,7 @@ Proxy rotation and management utilities.
 """
 
 import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 import requests
 from requests.exceptions import ProxyError
@@ -27,28 +28,36 @@ class ProxyRotator:
         self.current_proxy = None
         self.bad_proxies = set()
         self.logger = logging.getLogger(__name__)
+        # Keys are parsed once; self.proxies keeps the dicts alive, so their
+        # ids stay valid for looking up the proxies handed out by get_proxy().
+        self._keys = [self._proxy_key(p) for p in self.proxies]
+        self._key_by_id = {id(p): k for p, k in zip(self.proxies, self._keys)}
+        self._available = list(self.proxies)
 
     def get_proxy(self) -> Optional[Dict]:
         """Get a random working proxy."""
         if not self.proxies:
             return None
 
-        available_proxies = [
-            p for p in self.proxies
-            if self._proxy_key(p) not in self.bad_proxies
-        ]
-
-        if not available_proxies:
+        if not self._available:
             self.logger.warning("No working proxies available")
             return None
 
-        self.current_proxy = random.choice(available_proxies)
+        self.current_proxy = random.choice(self._available)
         return self.current_proxy
 
     def mark_bad(self, proxy: Dict) -> None:
         """Mark a proxy as bad (failed)."""
-        proxy_key = self._proxy_key(proxy)
-        self.bad_proxies.add(proxy_key)
+        proxy_key = self._key_by_id.get(id(proxy))
+        if proxy_key is None:
+            proxy_key = self._proxy_key(proxy)
+        if proxy_key not in self.bad_proxies:
+            self.bad_proxies.add(proxy_key)
+            # Several entries may share a host:port, so drop them all
+            self._available = [
+                p for p, k in zip(self.proxies, self._keys)
+                if k not in self.bad_proxies
+            ]
         self.logger.warning(f"Marked proxy as bad: {proxy_key}")
 
     def test_proxy(self, proxy: Dict, test_url: str = 'https://www.google.com') -> bool:
@@ -64,6 +73,34 @@ class ProxyRotator:
             self.logger.debug(f"Proxy test failed: {e}")
             return False
 
+    def validate_all(self, test_url: str = 'https://www.google.com', max_workers: int = 16) -> List[Dict]:
+        """
+        Tests all currently available proxies concurrently and marks failures as bad.
+
+        Each proxy goes through `test_proxy` on a thread pool, so validating
+        the pool takes roughly one round trip instead of one per proxy.
+
+        Args:
+            test_url: URL each proxy must fetch with a 200 response.
+            max_workers: Upper bound on proxies tested at the same time.
+
+        Returns:
+            The proxies that passed.
+        """
+        candidates = list(self._available)
+        if not candidates:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(candidates)), thread_name_prefix="proxy-test") as executor:
+            results = list(executor.map(lambda p: self.test_proxy(p, test_url), candidates))
+
+        for proxy, ok in zip(candidates, results):
+            if not ok:
+                self.mark_bad(proxy)
+        working = [p for p, ok in zip(candidates, results) if ok]
+        self.logger.info(f"Proxy validation: {len(working)}/{len(candidates)} working")
+        return working
+
     def _proxy_key(self, proxy: Dict) -> str:
         """Get unique key for a proxy configuration."""
         http_proxy = proxy.get('http', '')
@@ -2,7 +2,7 @@
 User agent string management and rotation.
 """
 
-from typing import List
+from typing import Dict, List
 import random
 
 # Common user agents for different browsers and devices
@@ -41,24 +41,19 @@ class UserAgentManager:
     def __init__(self, agents: Dict = None):
         """Initialize with custom user agents if provided."""
         self.user_agents = agents or USER_AGENTS
+        # Flattened once so rotation doesn't rebuild the pool on every request
+        self._by_type = {k: tuple(v) for k, v in self.user_agents.items()}
+        self._flat_agents = tuple(ua for lst in self._by_type.values() for ua in lst)
 
     def get_random_user_agent(self, device_type: str = None) -> str:
         """Get a random user agent string."""
-        if device_type and device_type in self.user_agents:
-            return random.choice(self.user_agents[device_type])
-        else:
-            # Combine all user agents if no specific type requested
-            all_agents = []
-            for agents in self.user_agents.values():
-                all_agents.extend(agents)
-            return random.choice(all_agents)
+        if device_type and device_type in self._by_type:
+            return random.choice(self._by_type[device_type])
+        # Combine all user agents if no specific type requested
+        return random.choice(self._flat_agents)
 
     def get_user_agents(self, device_type: str = None) -> List[str]:
         """Get list of user agents for a specific device type."""
         if device_type and device_type in self.user_agents:
             return self.user_agents[device_type]
-        else:
-            all_agents = []
-            for agents in self.user_agents.values():
-                all_agents.extend(agents)
-            return all_agents
+        return list(self._flat_agents)